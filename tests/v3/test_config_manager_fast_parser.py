@@ -0,0 +1,56 @@
+"""FastConfigParser parity tests against stdlib configparser."""
+
+import configparser
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.config_manager import FastConfigParser
+
+
+def test_fast_parser_matches_configparser_on_shipped_config():
+    reference = configparser.ConfigParser()
+    reference.read("v3/config.ini", encoding="utf-8")
+
+    parser = FastConfigParser()
+    parser.read("v3/config.ini", encoding="utf-8")
+
+    assert parser.sections() == reference.sections()
+    for key, value in reference["Settings"].items():
+        assert parser["Settings"].get(key) == value, key
+
+
+def test_fast_parser_getters_and_comments():
+    parser = FastConfigParser()
+    parser.read_string(
+        "[Settings]\n"
+        "# commented = ignored\n"
+        "; also = ignored\n"
+        "Max_Workers = 3\r\n"
+        "empty_value =\n"
+        "ratio = 0.5\n"
+        "flag = Yes\n"
+        "pattern = ^[A-Z]=x$\n"
+    )
+    settings = parser["Settings"]
+
+    assert "commented" not in settings
+    assert settings.getint("max_workers", 1) == 3
+    assert settings.get("empty_value", "default") == ""
+    assert settings.getfloat("ratio", 1.0) == 0.5
+    assert settings.getboolean("flag", False) is True
+    assert settings.get("pattern") == "^[A-Z]=x$"
+    assert settings.getint("missing", 7) == 7
+
+
+
+def test_fast_parser_reads_file_with_bom_and_crlf(tmp_path):
+    path = tmp_path / "bom.ini"
+    path.write_bytes("\ufeff[Settings]\r\nmax_workers = 2\r\n".encode("utf-8"))
+
+    parser = FastConfigParser()
+    assert parser.read(str(path)) == [str(path)]
+    assert parser["Settings"].getint("max_workers") == 2
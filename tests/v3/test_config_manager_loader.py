@@ -0,0 +1,112 @@
+"""ConfigManager.load_from_file field parsing tests."""
+
+import sys
+from dataclasses import fields, replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.config_manager import ConfigManager, ExtractionConfig
+
+
+def _load(tmp_path, body: str) -> ExtractionConfig:
+    path = tmp_path / "config.ini"
+    path.write_text("[Settings]\n" + body, encoding="utf-8")
+    return ConfigManager.load_from_file(str(path))
+
+
+def test_unset_fields_fall_back_to_dataclass_defaults(tmp_path):
+    config = _load(tmp_path, "")
+    assert config == ExtractionConfig()
+
+
+def test_missing_settings_section_or_file_gives_defaults(tmp_path):
+    path = tmp_path / "other.ini"
+    path.write_text("[Other]\nmax_workers = 9\n", encoding="utf-8")
+
+    assert ConfigManager.load_from_file(str(path)) == ExtractionConfig()
+    assert ConfigManager.load_from_file(str(tmp_path / "missing.ini")) == ExtractionConfig()
+
+
+def test_every_field_is_typed_from_ini(tmp_path):
+    config = _load(
+        tmp_path,
+        "header_area_top = 2.5\n"
+        "max_workers = 2\n"
+        "enable_clahe = false\n"
+        "input_folder = inbox\n"
+        "pages_to_read = 1, 3\n"
+        "pattern_serial_allowed_prefixes = s, r, x\n",
+    )
+
+    assert config.header_area_top == 2.5
+    assert config.max_workers == 2
+    assert config.enable_clahe is False
+    assert config.input_folder == "inbox"
+    assert config.pages_to_read == (1, 3)
+    assert config.pattern_serial_allowed_prefixes == ("S", "R", "X")
+
+
+def test_shipped_config_sets_every_scalar_type():
+    config = ConfigManager.load_from_file("v3/config.ini")
+    for f in fields(ExtractionConfig):
+        value = getattr(config, f.name)
+        if f.type in (bool, int, str):
+            assert type(value) is f.type, f.name
+        elif f.type is float:
+            assert isinstance(value, float), f.name
+
+
+def test_unchanged_file_returns_cached_instance(tmp_path):
+    first = _load(tmp_path, "max_workers = 2\n")
+    assert ConfigManager.load_from_file(str(tmp_path / "config.ini")) is first
+
+    changed = _load(tmp_path, "max_workers = 12\n")
+    assert changed is not first
+    assert changed.max_workers == 12
+
+
+def test_pair_and_whitelist_strings_are_pre_parsed(tmp_path):
+    config = _load(
+        tmp_path,
+        "ambiguous_characters = s:5, B:8,bad,OO:0\n"
+        "character_whitelist = AB-\n",
+    )
+
+    assert config.ambiguous_pairs_tuple == (("S", "5"), ("B", "8"))
+    assert config.whitelist_set == frozenset("AB-")
+    assert config.compiled_header_pattern.pattern == config.header_pattern
+
+
+def test_code_classifier_settings_load_into_flat_fields(tmp_path):
+    config = _load(
+        tmp_path,
+        "code_char_classifier_min_confidence = 0.5\n"
+        "enable_code_char_classifier = false\n",
+    )
+
+    assert config.code_char_classifier_min_confidence == 0.5
+    assert config.enable_code_char_classifier is False
+    assert not hasattr(config, "code")
+
+
+def test_list_settings_are_tuples_and_config_is_hashable(tmp_path):
+    config = _load(tmp_path, "pages_to_read = all\n")
+
+    assert config.pages_to_read == ()
+    assert config.pattern_serial_allowed_prefixes == ("S", "R")
+    assert hash(config) == hash(replace(config))
+
+
+def test_string_values_are_shared_between_configs(tmp_path):
+    whitelist = "".join(["ABC", "-"])
+    first = _load(tmp_path, f"character_whitelist = {whitelist}\n")
+    other = tmp_path / "other"
+    other.mkdir()
+    second = _load(other, f"character_whitelist = {whitelist}\n")
+
+    assert first is not second
+    assert first.character_whitelist is second.character_whitelist
+    assert first.input_folder is second.input_folder
@@ -0,0 +1,318 @@
+"""CSVReporter Excel/CSV report writing tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from v3.utils.csv_reporter import CSVReporter
+
+
+def _reporter(tmp_path, use_excel=True) -> CSVReporter:
+    reporter = CSVReporter(output_folder=str(tmp_path), organize_by_date=False, use_excel=use_excel)
+    reporter.add_extraction("a.pdf", 1, "A-B12-S1234567", 250, "tesseract", 12.345)
+    reporter.add_extraction("a.pdf", 2, "A-B12-S7654321", 90, "paddle", 20.0, status="low_confidence")
+    reporter.add_extraction("b.pdf", 1, "", 0, "none", 5.0, status="error", error_message="no text")
+    return reporter
+
+
+def test_excel_report_has_summary_header_and_highlighted_rows(tmp_path):
+    reporter = _reporter(tmp_path)
+    path = reporter.flush_to_csv(summary_stats={"total_pages": 3, "success_rate": "33.3%"})
+
+    assert path.suffix == ".xlsx"
+    assert len(reporter.pending_records) == 0
+    ws = openpyxl.load_workbook(path)["Extraction Report"]
+
+    assert ws["A1"].value == "SUMMARY STATISTICS"
+    assert "A1:D1" in {str(r) for r in ws.merged_cells.ranges}
+    assert ws["A2"].value == "Total Pages" and ws["B2"].value == "3"
+    assert ws["A2"].fill.fgColor.rgb.endswith("E7E6E6")
+
+    header = [cell.value for cell in ws[5]]
+    assert header[:3] == ["Timestamp", "Pdf Filename", "Page Number"]
+    assert ws["A5"].font.bold
+
+    assert [cell.value for cell in ws[6]][1:5] == ["a.pdf", 1, "A-B12-S1234567", 250]
+    assert ws["B6"].fill.fill_type is None
+    assert ws["B7"].fill.fgColor.rgb.endswith("FFC000")
+    assert ws["B8"].fill.fgColor.rgb.endswith("FF0000")
+    assert ws["J8"].value == "no text"
+
+
+def test_excel_column_widths_fit_longest_value(tmp_path):
+    reporter = _reporter(tmp_path)
+    path = reporter.flush_to_csv()
+    ws = openpyxl.load_workbook(path)["Extraction Report"]
+
+    assert ws.column_dimensions["A"].width == len("2024-01-01 00:00:00") + 2  # Value wider than header
+    assert ws.column_dimensions["B"].width == len("Pdf Filename") + 2  # Header wider than values
+
+
+def test_csv_report_round_trips_summary(tmp_path):
+    reporter = _reporter(tmp_path, use_excel=False)
+    path = reporter.flush_to_csv()
+
+    assert path.suffix == ".csv"
+    summary = reporter.generate_summary_report(path)
+    assert summary["total_pages"] == 3
+    assert summary["error_count"] == 1
+    assert summary["low_confidence_count"] == 1
+    assert summary["success_rate"] == "33.3%"
+    assert summary["avg_confidence_score"] == round(340 / 3, 1)
+    assert summary["avg_processing_time_ms"] == round((12.35 + 20.0 + 5.0) / 3, 2)
+    assert summary["unique_headers"] == 2
+    assert summary["unique_split_groups"] == 0
+
+
+def test_error_excel_report_lists_only_flagged_rows(tmp_path):
+    reporter = _reporter(tmp_path)
+    flagged = [r for r in reporter.pending_records if r.status != "success"]
+    path = reporter.flush_to_csv()
+
+    error_path = reporter.create_error_report(path, flagged)
+    ws = openpyxl.load_workbook(error_path)["Error Report"]
+
+    assert ws.max_row == 3
+    assert ws["A1"].fill.fgColor.rgb.endswith("FF0000") and ws["A1"].font.bold
+    assert ws["B2"].fill.fgColor.rgb.endswith("FFC000")
+    assert ws["B3"].fill.fgColor.rgb.endswith("FF0000")
+
+
+def test_csv_rows_follow_record_field_order(tmp_path):
+    import csv
+
+    reporter = _reporter(tmp_path, use_excel=False)
+    flagged = [r for r in reporter.pending_records if r.status != "success"]
+    path = reporter.flush_to_csv()
+    error_path = reporter.create_error_report(path, flagged)
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:4] == ["timestamp", "pdf_filename", "page_number", "header_extracted"]
+    assert rows[1][1:7] == ["a.pdf", "1", "A-B12-S1234567", "250", "tesseract", "12.35"]
+
+    with open(error_path, encoding="utf-8-sig", newline="") as f:
+        error_rows = list(csv.DictReader(f))
+    assert [row["status"] for row in error_rows] == ["low_confidence", "error"]
+
+
+def test_error_excel_column_widths_are_capped(tmp_path):
+    reporter = _reporter(tmp_path)
+    reporter.pending_records[2].error_message = "x" * 80
+    flagged = [r for r in reporter.pending_records if r.status != "success"]
+    path = reporter.flush_to_csv()
+
+    ws = openpyxl.load_workbook(reporter.create_error_report(path, flagged))["Error Report"]
+    assert ws.column_dimensions["J"].width == 50
+    assert ws.column_dimensions["I"].width == len("low_confidence") + 2
+
+
+def test_daily_summary_streams_all_of_todays_reports(tmp_path):
+    import csv
+    from datetime import datetime
+
+    reporter = CSVReporter(output_folder=str(tmp_path), use_excel=False)
+    day_folder = tmp_path / datetime.now().strftime("%Y-%m-%d")
+    day_folder.mkdir()
+    header = "timestamp,pdf_filename,status\n"
+    (day_folder / "extraction_report_1.csv").write_text(
+        "# SUMMARY STATISTICS\n# total_pages,1\n\n" + header + "2024-01-01 00:00:00,a.pdf,success\n",
+        encoding="utf-8-sig",
+    )
+    (day_folder / "extraction_report_2.csv").write_text(
+        "status,timestamp,pdf_filename\nerror,2024-01-01 00:00:01,b.pdf\n,,\n",
+        encoding="utf-8-sig",
+    )
+
+    summary_path = reporter.create_daily_summary()
+
+    with open(summary_path, encoding="utf-8-sig", newline="") as f:
+        rows = [row for row in csv.reader(f) if row and not row[0].startswith("#")]
+    assert rows == [
+        ["timestamp", "pdf_filename", "status"],
+        ["2024-01-01 00:00:00", "a.pdf", "success"],
+        ["2024-01-01 00:00:01", "b.pdf", "error"],
+    ]
+
+
+def test_daily_summary_without_records_is_not_written(tmp_path):
+    from datetime import datetime
+
+    reporter = CSVReporter(output_folder=str(tmp_path), use_excel=False)
+    day_folder = tmp_path / datetime.now().strftime("%Y-%m-%d")
+    day_folder.mkdir()
+    (day_folder / "extraction_report_1.csv").write_text("timestamp,status\n", encoding="utf-8-sig")
+
+    assert reporter.create_daily_summary() is None
+    assert not list(day_folder.glob("daily_summary_*"))
+
+
+def test_record_timestamps_match_wall_clock_format(tmp_path):
+    from datetime import datetime
+
+    reporter = _reporter(tmp_path)
+    stamps = {record.timestamp for record in reporter.pending_records}
+
+    for stamp in stamps:
+        parsed = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S")
+        assert abs((datetime.now() - parsed).total_seconds()) < 5
+
+
+def _stream_three(reporter: CSVReporter) -> Path:
+    path = reporter.start_stream()
+    reporter.add_extraction("a.pdf", 1, "A-B12-S1234567", 250, "tesseract", 12.345)
+    reporter.add_extraction("a.pdf", 2, "A-B12-S7654321", 90, "paddle", 20.0, status="low_confidence")
+    reporter.add_extraction("b.pdf", 1, "", 0, "none", 5.0, status="error", error_message="no text")
+    return path
+
+
+def test_streamed_csv_report_appends_summary_after_rows(tmp_path):
+    reporter = CSVReporter(output_folder=str(tmp_path), organize_by_date=False, use_excel=False)
+    path = _stream_three(reporter)
+
+    assert len(reporter.pending_records) == 0
+    assert [r.status for r in reporter.streamed_error_records] == ["low_confidence", "error"]
+    assert reporter.flush_to_csv(summary_stats={"total_pages": 3}) == path
+
+    lines = path.read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0].startswith("timestamp,pdf_filename")
+    assert lines[-2:] == ["# SUMMARY STATISTICS", "# total_pages,3"]
+
+    summary = reporter.generate_summary_report(path)
+    assert summary["total_pages"] == 3
+    assert summary["error_count"] == 1
+
+
+def test_streamed_excel_report_has_header_first_and_summary_last(tmp_path):
+    reporter = CSVReporter(output_folder=str(tmp_path), organize_by_date=False)
+    path = _stream_three(reporter)
+    reporter.flush_to_csv(summary_stats={"total_pages": 3})
+
+    ws = openpyxl.load_workbook(path)["Extraction Report"]
+    assert ws["A1"].value == "Timestamp" and ws["A1"].font.bold
+    assert ws["B2"].value == "a.pdf"
+    assert ws["B3"].fill.fgColor.rgb.endswith("FFC000")
+    assert ws["A6"].value == "SUMMARY STATISTICS"
+    assert "A6:D6" in {str(r) for r in ws.merged_cells.ranges}
+    assert ws["A7"].value == "Total Pages" and ws["B7"].value == "3"
+
+    error_report = reporter.create_error_report(path, reporter.streamed_error_records)
+    assert openpyxl.load_workbook(error_report)["Error Report"].max_row == 3
+
+
+def test_daily_summary_statistics_come_from_copied_rows(tmp_path):
+    from datetime import datetime
+
+    day_folder = tmp_path / datetime.now().strftime("%Y-%m-%d")
+    source = _reporter(day_folder, use_excel=False)
+    source.flush_to_csv()
+
+    reporter = CSVReporter(output_folder=str(tmp_path), use_excel=False)
+    summary_path = reporter.create_daily_summary()
+
+    lines = summary_path.read_text(encoding="utf-8-sig").splitlines()
+    stats = dict(line[2:].split(",", 1) for line in lines if line.startswith("# ") and "," in line)
+    assert stats["total_pages"] == "3"
+    assert stats["error_count"] == "1"
+    assert stats["unique_headers"] == "2"
+
+
+def test_summary_report_accepts_in_memory_rows(tmp_path):
+    import csv
+
+    reporter = _reporter(tmp_path, use_excel=False)
+    path = reporter.flush_to_csv()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert reporter.generate_summary_report(records=rows) == reporter.generate_summary_report(path)
+
+
+def test_status_code_follows_status_and_is_not_written(tmp_path):
+    from v3.utils.csv_reporter import Status
+
+    reporter = _reporter(tmp_path, use_excel=False)
+    records = list(reporter.pending_records)
+    assert [r.status_code for r in records] == [Status.SUCCESS, Status.LOW_CONFIDENCE, Status.ERROR]
+    assert "status_code" not in records[0].to_dict()
+
+    records[0].status = "error"
+    assert records[0].status_code is Status.ERROR
+
+    path = reporter.flush_to_csv()
+    header = path.read_text(encoding="utf-8-sig").splitlines()
+    assert not any("status_code" in line or "Status." in line for line in header)
+
+
+def test_daily_summary_copies_rows_verbatim_with_one_bom(tmp_path):
+    from datetime import datetime
+
+    reporter = CSVReporter(output_folder=str(tmp_path), use_excel=False)
+    day_folder = tmp_path / datetime.now().strftime("%Y-%m-%d")
+    day_folder.mkdir()
+    header = "timestamp,pdf_filename,error_message\r\n"
+    first = '2024-01-01 00:00:00,a.pdf,"line one\r\nline two"\r\n'
+    second = "2024-01-01 00:00:01,b.pdf,"
+    (day_folder / "extraction_report_1.csv").write_text(header + first, encoding="utf-8-sig", newline="")
+    (day_folder / "extraction_report_2.csv").write_text(header + second, encoding="utf-8-sig", newline="")
+
+    data = reporter.create_daily_summary().read_bytes()
+
+    assert data.count(b"\xef\xbb\xbf") == 1
+    assert data.startswith(b"\xef\xbb\xbf" + (header + first + second + "\r\n").encode())
+
+
+def test_unique_counts_exact_and_estimated(tmp_path):
+    reporter = _reporter(tmp_path, use_excel=False)
+    path = reporter.flush_to_csv()
+
+    assert reporter.generate_summary_report(path, exact_unique=True)["unique_headers"] == 2
+
+    pytest.importorskip("datasketch")
+    rows = [{"timestamp": "t", "status": "success", "confidence_score": "1", "processing_time_ms": "1",
+             "header_extracted": f"H{i % 500}", "split_group": ""} for i in range(5000)]
+    estimate = reporter.generate_summary_report(records=rows)["unique_headers"]
+    assert abs(estimate - 500) <= 25
+
+
+def test_async_flush_hands_off_pending_records(tmp_path):
+    reporter = _reporter(tmp_path, use_excel=False)
+    future = reporter.flush_to_csv_async()
+    assert not reporter.pending_records
+
+    reporter.add_extraction("c.pdf", 1, "C-1", 200, "tesseract", 1.0)
+    path = future.result(timeout=10)
+    reporter.close()
+
+    assert reporter.generate_summary_report(path)["total_pages"] == 3
+    assert len(reporter.pending_records) == 1
+
+
+def test_failed_async_flush_keeps_records_pending(tmp_path, monkeypatch):
+    reporter = _reporter(tmp_path, use_excel=False)
+    monkeypatch.setattr(reporter, "_write_report", lambda *args: None)
+    future = reporter.flush_to_csv_async()
+
+    reporter.add_extraction("c.pdf", 1, "C-1", 200, "tesseract", 1.0)
+    assert future.result(timeout=10) is None
+    reporter.close()
+
+    assert [r.pdf_filename for r in reporter.pending_records] == ["a.pdf", "a.pdf", "b.pdf", "c.pdf"]
+    monkeypatch.undo()
+    assert reporter.generate_summary_report(reporter.flush_to_csv())["total_pages"] == 4
+
+
+def test_excel_styles_rows_by_the_status_at_write_time(tmp_path):
+    reporter = _reporter(tmp_path)
+    reporter.pending_records[0].status = "error"
+    path = reporter.flush_to_csv(summary_stats={"total_pages": 3, "success_rate": "33.3%"})
+
+    ws = openpyxl.load_workbook(path)["Extraction Report"]
+    assert ws["B6"].fill.fgColor.rgb.endswith("FF0000")
@@ -0,0 +1,54 @@
+"""DebugImageManager.cleanup_old_images tests."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.debug_manager import DebugImageManager
+
+
+def _touch(path: Path, age_days: float) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    mtime = time.time() - age_days * 86400
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cleanup_removes_only_old_images_recursively(tmp_path):
+    old_top = _touch(tmp_path / "old.png", 40)
+    old_nested = _touch(tmp_path / "2024-01-01" / "deep" / "old.png", 40)
+    old_jpg = _touch(tmp_path / "2024-01-01" / "old.jpg", 40)
+    recent = _touch(tmp_path / "2024-01-01" / "recent.png", 1)
+    old_other = _touch(tmp_path / "old.txt", 40)
+
+    manager = DebugImageManager(base_folder=str(tmp_path), retention_days=0)
+    manager.retention_days = 30
+
+    assert manager.cleanup_old_images() == 3
+    assert not old_top.exists() and not old_nested.exists() and not old_jpg.exists()
+    assert recent.exists() and old_other.exists()
+
+
+def test_cleanup_is_disabled_without_retention(tmp_path):
+    old = _touch(tmp_path / "old.png", 400)
+    manager = DebugImageManager(base_folder=str(tmp_path), retention_days=0)
+
+    assert manager.cleanup_old_images() == 0
+    assert old.exists()
+
+
+def test_startup_cleanup_runs_in_background(tmp_path):
+    old = _touch(tmp_path / "2024-01-01" / "old.png", 40)
+    recent = _touch(tmp_path / "recent.png", 1)
+
+    manager = DebugImageManager(base_folder=str(tmp_path), retention_days=30)
+
+    assert manager.wait_for_cleanup(timeout=10)
+    assert not old.exists()
+    assert recent.exists()
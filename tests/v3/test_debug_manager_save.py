@@ -0,0 +1,83 @@
+"""DebugImageManager.save_image tests."""
+
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.debug_manager import DebugImageManager
+
+
+def test_saved_images_are_written_by_close(tmp_path):
+    image = np.zeros((8, 12), dtype=np.uint8)
+    image[2:5, 3:9] = 255
+    manager = DebugImageManager(
+        base_folder=str(tmp_path), organize_by_date=False, retention_days=0, debug_format="png"
+    )
+
+    path = manager.save_image(image, "doc.pdf", 2, "otsu")
+    assert path.name.startswith("doc_page2_otsu_") and path.suffix == ".png"
+
+    assert manager.close(timeout=10)
+    assert np.array_equal(cv2.imread(str(path), cv2.IMREAD_GRAYSCALE), image)
+
+
+def test_default_format_is_jpg(tmp_path):
+    image = np.full((16, 16, 3), 128, dtype=np.uint8)
+    manager = DebugImageManager(base_folder=str(tmp_path), organize_by_date=False, retention_days=0)
+
+    path = manager.save_image(image, "doc.pdf", 1)
+    assert manager.close(timeout=10)
+
+    assert path.suffix == ".jpg"
+    assert cv2.imread(str(path)).shape == image.shape
+
+
+def test_saves_after_close_start_a_new_writer(tmp_path):
+    image = np.zeros((8, 8), dtype=np.uint8)
+    manager = DebugImageManager(
+        base_folder=str(tmp_path), organize_by_date=False, retention_days=0, debug_format="png"
+    )
+
+    first = manager.save_image(image, "doc.pdf", 1)
+    assert manager.close(timeout=10)
+    second = manager.save_image(image, "doc.pdf", 2)
+    assert manager.close(timeout=10)
+
+    assert first.exists() and second.exists()
+
+
+def test_close_racing_saves_loses_no_images(tmp_path):
+    import threading
+
+    image = np.zeros((8, 8), dtype=np.uint8)
+    manager = DebugImageManager(
+        base_folder=str(tmp_path), organize_by_date=False, retention_days=0, debug_format="png"
+    )
+    paths = []
+
+    def save(page_nums):
+        for page_num in page_nums:
+            paths.append(manager.save_image(image, "doc.pdf", page_num))
+
+    savers = [threading.Thread(target=save, args=(range(i, 200, 4),)) for i in range(4)]
+    for saver in savers:
+        saver.start()
+    while any(saver.is_alive() for saver in savers):
+        assert manager.close(timeout=10)
+    for saver in savers:
+        saver.join()
+    assert manager.close(timeout=10)
+
+    assert len(paths) == 200 and all(path.exists() for path in paths)
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        DebugImageManager(base_folder=str(tmp_path), retention_days=0, debug_format="bmp")
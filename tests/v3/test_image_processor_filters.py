@@ -0,0 +1,219 @@
+"""ImageProcessor filter pipelines match the plain OpenCV call sequences."""
+
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.image_processor import ImageProcessor
+
+OTSU = cv2.THRESH_BINARY + cv2.THRESH_OTSU
+
+
+def _page(seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    gray = np.full((120, 200), 230, dtype=np.uint8)
+    gray[30:34, 10:190] = 20  # Horizontal rule
+    cv2.putText(gray, "A-B12", (20, 90), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 30, 3)
+    noise = rng.integers(0, 25, gray.shape, dtype=np.uint8)
+    return cv2.subtract(gray, noise)
+
+
+def _reference_median_blur(gray):
+    _, thresh = cv2.threshold(cv2.medianBlur(gray, 3), 0, 255, OTSU)
+    return cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (2, 1)))
+
+
+def _reference_black_hat(gray):
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (13, 5))
+    _, result = cv2.threshold(cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, kernel), 0, 255, OTSU)
+    return result
+
+
+def _reference_contrast(gray):
+    enhanced = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8)).apply(gray)
+    sharpened = cv2.filter2D(enhanced, -1, np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]))
+    _, result = cv2.threshold(sharpened, 0, 255, OTSU)
+    return result
+
+
+def _reference_opening(gray):
+    _, binary = cv2.threshold(cv2.GaussianBlur(gray, (5, 5), 0), 0, 255, OTSU)
+    opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2)))
+    return cv2.dilate(opening, cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2)))
+
+
+def _reference_bilateral(gray):
+    _, result = cv2.threshold(cv2.bilateralFilter(gray, 9, 75, 75), 0, 255, OTSU)
+    return result
+
+
+@pytest.mark.parametrize("method, reference", [
+    (ImageProcessor.apply_median_blur, _reference_median_blur),
+    (ImageProcessor.apply_black_hat, _reference_black_hat),
+    (ImageProcessor.apply_contrast_enhancement, _reference_contrast),
+    (ImageProcessor.apply_morphological_opening, _reference_opening),
+    (ImageProcessor.apply_bilateral_filter, _reference_bilateral),
+])
+def test_filters_match_reference_and_leave_input_untouched(method, reference):
+    gray = _page()
+    original = gray.copy()
+
+    assert np.array_equal(method(gray), reference(gray))
+    assert np.array_equal(gray, original)
+
+
+def test_line_removal_erases_rule_and_keeps_text():
+    gray = _page()
+    result = ImageProcessor.apply_line_removal(gray)
+
+    # Inverted back: text/ink is 0, background 255
+    assert (result[28:36, 100:190] == 255).all()
+    assert (result[60:95, 20:110] == 0).any()
+
+
+def test_cached_clahe_gives_same_result_across_calls_and_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages = [_page(seed) for seed in range(4)]
+    expected = [_reference_contrast(page) for page in pages]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(ImageProcessor.apply_contrast_enhancement, pages * 3))
+
+    for i, result in enumerate(results):
+        assert np.array_equal(result, expected[i % len(pages)])
+
+
+@pytest.mark.parametrize("height, width", [(120, 200), (1200, 1600)])
+def test_hough_line_removal_erases_thin_rule_at_any_size(height, width):
+    # The larger page is above the downscale threshold: lines are found at half size
+    gray = np.full((height, width), 230, dtype=np.uint8)
+    row = height // 4
+    gray[row:row + 3, width // 20:width - width // 20] = 20
+    cv2.putText(gray, "A-B12", (width // 10, height * 3 // 4), cv2.FONT_HERSHEY_SIMPLEX, height / 80, 30, 3)
+
+    result = ImageProcessor.apply_hough_line_removal(gray)
+
+    assert result.shape == gray.shape
+    band = result[row - 1:row + 4, width // 10:width - width // 10]
+    assert (band == 255).mean() > 0.9
+    assert (result[height // 2:, :] == 0).any()  # Text survives
+
+
+def test_otsu_denoise_strengths():
+    gray = _page()
+
+    fast = ImageProcessor.apply_otsu_threshold(gray, denoise=True)
+    _, expected_fast = cv2.threshold(cv2.bilateralFilter(gray, 5, 50, 50), 0, 255, OTSU)
+    assert np.array_equal(fast, expected_fast)
+
+    strong = ImageProcessor.apply_otsu_threshold(gray, denoise=True, denoise_strength="strong")
+    _, expected_strong = cv2.threshold(cv2.fastNlMeansDenoising(gray, None, 10, 7, 21), 0, 255, OTSU)
+    assert np.array_equal(strong, expected_strong)
+
+    with pytest.raises(ValueError):
+        ImageProcessor.apply_otsu_threshold(gray, denoise=True, denoise_strength="medium")
+
+
+def test_process_batch_keeps_page_order():
+    pages = [_page(seed) for seed in range(5)]
+
+    results = ImageProcessor.process_batch(pages, "apply_simple_threshold", threshold=150)
+
+    assert len(results) == len(pages)
+    for page, result in zip(pages, results):
+        assert np.array_equal(result, ImageProcessor.apply_simple_threshold(page, threshold=150))
+    with pytest.raises(ValueError):
+        ImageProcessor.process_batch(pages, "pil_to_cv2")
+
+
+def test_process_batch_rejects_a_shared_out_buffer():
+    pages = [_page(seed) for seed in range(3)]
+
+    with pytest.raises(ValueError):
+        ImageProcessor.process_batch(
+            pages, "apply_simple_threshold", threshold=100, out=np.empty_like(pages[0])
+        )
+
+
+def test_pil_conversions():
+    from PIL import Image
+
+    rgb = np.random.default_rng(1).integers(0, 256, (40, 60, 3), dtype=np.uint8)
+    pil_image = Image.fromarray(rgb)
+
+    color, gray = ImageProcessor.pil_to_cv2(pil_image)
+    assert np.array_equal(color, rgb[:, :, ::-1])
+    assert np.array_equal(gray, cv2.cvtColor(color, cv2.COLOR_BGR2GRAY))
+    assert np.array_equal(ImageProcessor.pil_to_bgr(pil_image), color)
+
+    fast_gray = ImageProcessor.pil_to_gray(pil_image)
+    assert fast_gray.shape == gray.shape and fast_gray.dtype == np.uint8
+    assert np.abs(fast_gray.astype(int) - gray).max() <= 1
+
+
+@pytest.mark.parametrize("use_umat", [False, True])
+def test_pipeline_matches_chained_calls(monkeypatch, use_umat):
+    import v3.utils.image_processor as image_processor
+
+    # UMat also runs (on the CPU) without an OpenCL device
+    monkeypatch.setattr(image_processor, "OPENCL_AVAILABLE", use_umat)
+    monkeypatch.setattr(cv2.ocl, "useOpenCL", lambda: use_umat)
+    gray = _page()
+    steps = ["apply_bilateral_filter", "apply_median_blur", "apply_black_hat", "apply_contrast_enhancement"]
+
+    expected = gray
+    for step in steps:
+        expected = getattr(ImageProcessor, step)(expected)
+
+    result = ImageProcessor.pipeline(gray, steps)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, expected)
+    with pytest.raises(ValueError):
+        ImageProcessor.pipeline(gray, ["apply_hough_line_removal"])
+
+
+def test_pipeline_leaves_the_opencl_switch_alone(monkeypatch):
+    import v3.utils.image_processor as image_processor
+
+    # An operator turned OpenCL off (e.g. for a buggy driver): stay on the CPU
+    monkeypatch.setattr(image_processor, "OPENCL_AVAILABLE", True)
+    monkeypatch.setattr(cv2.ocl, "useOpenCL", lambda: False)
+    switched = []
+    monkeypatch.setattr(cv2.ocl, "setUseOpenCL", switched.append)
+    step_inputs = []
+
+    def median_blur(image):
+        step_inputs.append(image)
+        return image
+
+    monkeypatch.setattr(ImageProcessor, "apply_median_blur", staticmethod(median_blur))
+
+    ImageProcessor.pipeline(_page(), ["apply_median_blur"])
+
+    assert [type(img) for img in step_inputs] == [np.ndarray]
+    assert switched == []
+
+
+@pytest.mark.parametrize("method_name", [
+    "apply_simple_threshold", "apply_otsu_threshold", "apply_adaptive_threshold",
+    "apply_bilateral_filter", "apply_median_blur", "apply_line_removal", "apply_black_hat",
+    "apply_contrast_enhancement", "apply_morphological_opening", "apply_hough_line_removal",
+    "filter_black_text",
+])
+def test_out_buffer_receives_result(method_name):
+    method = getattr(ImageProcessor, method_name)
+    gray = _page()
+    out = np.empty_like(gray)
+
+    result = method(gray, out=out)
+
+    assert result is out
+    assert np.array_equal(out, method(gray))
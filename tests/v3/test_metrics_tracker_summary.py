@@ -0,0 +1,122 @@
+"""MetricsTracker per-job metrics and summary tests."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.metrics_tracker import MetricsTracker, ProcessingMetrics
+
+
+def test_errors_keep_first_five_messages_and_full_count():
+    tracker = MetricsTracker()
+    tracker.start_job("job1", "a.pdf", total_pages=2)
+    for i in range(8):
+        tracker.record_error("job1", f"error {i}")
+
+    metrics = tracker.end_job("job1")
+    data = metrics.to_dict()
+
+    assert data["errors_count"] == 8
+    assert data["errors"] == [f"error {i}" for i in range(5)]
+    assert not hasattr(metrics, "__dict__")
+    assert isinstance(metrics, ProcessingMetrics)
+
+
+def test_running_summary_matches_full_scan():
+    tracker = MetricsTracker()
+    for i, pages in enumerate([3, 1, 4]):
+        job_id = f"job{i}"
+        metrics = tracker.start_job(job_id, f"{job_id}.pdf", total_pages=pages)
+        metrics._start_ns -= (i + 1) * 10**9
+        tracker.record_ocr_attempt(job_id, successful=i != 1, score=200)
+        tracker.record_api_call(job_id, successful=True)
+        tracker.end_job(job_id)
+
+    summary = tracker.get_summary()
+
+    assert summary == tracker._summary_from_jobs(tracker.completed_jobs)
+    assert summary.total_jobs == 3
+    assert summary.total_pages_processed == 8
+    assert summary.ocr_success_rate == round(2 / 3 * 100, 2)
+    assert summary.fastest_job < summary.slowest_job
+
+
+def test_empty_summary_has_zero_range():
+    summary = MetricsTracker().get_summary()
+    assert summary.total_jobs == 0
+    assert summary.fastest_job == 0 and summary.slowest_job == 0
+
+
+def test_export_writes_summary_and_daily_files(tmp_path):
+    import json
+
+    tracker = MetricsTracker()
+    tracker.start_job("job1", "ก.pdf", total_pages=1)
+    tracker.end_job("job1")
+
+    tracker.export_to_json(str(tmp_path / "metrics.json"))
+
+    data = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert data["summary"]["total_jobs"] == 1
+    assert data["completed_jobs"][0]["filename"] == "ก.pdf"
+    daily = list((tmp_path / "daily").glob("performance_metrics_*.json"))
+    assert len(daily) == 1
+    assert json.loads(daily[0].read_text(encoding="utf-8"))["summary"]["total_jobs"] == 1
+
+
+def test_duration_uses_monotonic_clock_not_wall_clock():
+    tracker = MetricsTracker()
+    metrics = tracker.start_job("job1", "a.pdf")
+    metrics.start_time -= 3600  # Wall clock jumped; duration must not follow
+    tracker.end_job("job1")
+
+    assert 0 <= metrics.processing_time_seconds < 5
+    assert metrics.end_time >= metrics.start_time
+
+
+def test_disabled_tracker_records_nothing():
+    tracker = MetricsTracker(enable_tracking=False)
+
+    assert tracker.start_job("job1", "a.pdf") is None
+    tracker.record_ocr_attempt("job1", successful=True, score=10)
+    tracker.record_error("job1", "boom")
+    assert tracker.end_job("job1") is None
+    assert tracker.get_summary().total_jobs == 0
+
+
+def test_jobs_grouped_by_local_completion_day():
+    from datetime import datetime
+
+    tracker = MetricsTracker()
+    stamps = [
+        datetime(2024, 3, 1, 23, 59, 59).timestamp(),
+        datetime(2024, 3, 1, 8, 0).timestamp(),
+        datetime(2024, 3, 2, 0, 0).timestamp(),
+        datetime(2024, 3, 5, 12, 0).timestamp(),
+    ]
+    for i, stamp in enumerate(stamps):
+        tracker.start_job(f"job{i}", "a.pdf")
+        tracker.end_job(f"job{i}").end_time = stamp
+
+    grouped = tracker._group_completed_jobs_by_day()
+
+    assert {day: [job.job_id for job in jobs] for day, jobs in grouped.items()} == {
+        "2024-03-01": ["job1", "job0"],
+        "2024-03-02": ["job2"],
+        "2024-03-05": ["job3"],
+    }
+
+
+def test_bounded_history_keeps_full_summary_totals():
+    tracker = MetricsTracker(max_history=2)
+    for i in range(5):
+        tracker.start_job(f"job{i}", "a.pdf", total_pages=1)
+        tracker.end_job(f"job{i}")
+
+    assert [job.job_id for job in tracker.completed_jobs] == ["job3", "job4"]
+    summary = tracker.get_summary()
+    assert summary.total_jobs == 5
+    assert summary.total_pages_processed == 5
@@ -0,0 +1,43 @@
+"""OCRContext validation and derived-context tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.ocr_context import OCRContext
+
+
+def test_context_has_no_instance_dict_and_stays_frozen():
+    context = OCRContext(filename="a.pdf", page_num=2)
+
+    assert not hasattr(context, "__dict__")
+    with pytest.raises(AttributeError):
+        context.page_num = 3
+
+
+def test_with_scale_and_job_id_copy_the_other_fields():
+    context = OCRContext(filename="a.pdf", page_num=2, render_scale=2.0, job_id="j1")
+
+    scaled = context.with_scale(6.0)
+    tagged = context.with_job_id("j2")
+
+    assert scaled == OCRContext(filename="a.pdf", page_num=2, render_scale=6.0, job_id="j1")
+    assert tagged == OCRContext(filename="a.pdf", page_num=2, render_scale=2.0, job_id="j2")
+    assert hash(scaled) == hash(OCRContext("a.pdf", 2, 6.0, "j1"))
+    assert context.render_scale == 2.0 and context.job_id == "j1"
+
+
+@pytest.mark.parametrize("kwargs", [{"page_num": 0}, {"page_num": 1, "render_scale": 0}])
+def test_invalid_context_is_rejected(kwargs):
+    with pytest.raises(ValueError):
+        OCRContext(filename="a.pdf", **kwargs)
+
+
+def test_with_scale_still_rejects_non_positive_scale():
+    with pytest.raises(ValueError):
+        OCRContext(filename="a.pdf", page_num=1).with_scale(-1.0)
@@ -0,0 +1,115 @@
+"""OCREnhancer skew detection and image enhancement tests."""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.config_manager import ExtractionConfig
+from v3.utils.ocr_enhancer import OCREnhancer
+
+
+def _ruled_page(angle: float, size=(1200, 1600)) -> np.ndarray:
+    """White page with dark horizontal rules, rotated by angle degrees"""
+    h, w = size
+    page = np.full((h, w), 255, dtype=np.uint8)
+    for y in range(100, h - 100, 60):
+        cv2.line(page, (100, y), (w - 100, y), 0, 3)
+    M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
+    return cv2.warpAffine(page, M, (w, h), borderValue=255)
+
+
+@pytest.mark.parametrize("size", [(600, 800), (3300, 2550)])
+@pytest.mark.parametrize("angle", [0.0, 3.0, -4.0])
+def test_detect_skew_angle_recovers_rotation(angle, size):
+    enhancer = OCREnhancer(ExtractionConfig())
+
+    detected = enhancer._detect_skew_angle(_ruled_page(angle, size))
+
+    assert isinstance(detected, float)
+    # Image y grows downwards, so a counter-clockwise rotation reads as a negative slope
+    assert detected == pytest.approx(-angle, abs=0.2)
+
+
+def test_detect_skew_angle_blank_page_is_zero():
+    enhancer = OCREnhancer(ExtractionConfig())
+
+    assert enhancer._detect_skew_angle(np.full((400, 600), 255, dtype=np.uint8)) == 0.0
+
+
+def test_enhance_image_leaves_input_untouched():
+    enhancer = OCREnhancer(ExtractionConfig())
+    page = _ruled_page(3.0)
+    original = page.copy()
+
+    enhanced = enhancer.enhance_image(page)
+
+    assert enhanced is not page
+    assert np.array_equal(page, original)
+
+
+def test_enhance_image_with_everything_disabled_returns_input():
+    config = replace(
+        ExtractionConfig(),
+        enable_deskewing=False, enable_clahe=False, enable_morphological_ops=False
+    )
+    page = _ruled_page(0.0)
+
+    assert OCREnhancer(config).enhance_image(page) is page
+
+
+def test_clahe_is_reused_per_thread_and_matches_a_fresh_one():
+    from concurrent.futures import ThreadPoolExecutor
+    from v3.utils import ocr_enhancer
+
+    enhancer = OCREnhancer(ExtractionConfig())
+    page = _ruled_page(0.0, (400, 600))
+    expected = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(page)
+
+    assert ocr_enhancer._clahe() is ocr_enhancer._clahe()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: enhancer._apply_clahe(page), range(8)))
+        clahes = set(pool.map(lambda _: id(ocr_enhancer._clahe()), range(8)))
+
+    assert all(np.array_equal(r, expected) for r in results)
+    assert id(ocr_enhancer._clahe()) not in clahes
+
+
+@pytest.mark.parametrize("angle, interpolation", [(1.5, cv2.INTER_LINEAR), (4.0, cv2.INTER_CUBIC)])
+def test_deskew_uses_bilinear_for_small_angles(monkeypatch, angle, interpolation):
+    enhancer = OCREnhancer(ExtractionConfig())
+    monkeypatch.setattr(enhancer, "_detect_skew_angle", lambda image: angle)
+    page = _ruled_page(0.0, (400, 600))
+    M = cv2.getRotationMatrix2D((300, 200), angle, 1.0)
+
+    expected = cv2.warpAffine(page, M, (600, 400), flags=interpolation, borderMode=cv2.BORDER_REPLICATE)
+
+    assert np.array_equal(enhancer._deskew(page), expected)
+
+
+def test_deskew_skips_rotation_below_half_a_degree(monkeypatch):
+    enhancer = OCREnhancer(ExtractionConfig())
+    monkeypatch.setattr(enhancer, "_detect_skew_angle", lambda image: 0.3)
+    page = _ruled_page(0.0, (400, 600))
+
+    assert enhancer._deskew(page) is page
+
+
+def test_enhance_image_normalizes_depth_and_strided_views():
+    enhancer = OCREnhancer(ExtractionConfig())
+    page = _ruled_page(3.0, (400, 600))
+    expected = enhancer.enhance_image(page)
+
+    transposed = enhancer.enhance_image(np.ascontiguousarray(page.T).T)
+    wide = enhancer.enhance_image(page.astype(np.uint16) * 257)
+
+    assert transposed.dtype == wide.dtype == np.uint8
+    assert np.array_equal(transposed, expected)
+    assert np.array_equal(wide, expected)
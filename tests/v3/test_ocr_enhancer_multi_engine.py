@@ -0,0 +1,123 @@
+"""MultiEngineOCR voting tests with stand-in EasyOCR/PaddleOCR modules."""
+
+import sys
+import threading
+import types
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.config_manager import ExtractionConfig
+from v3.utils.ocr_enhancer import MultiEngineOCR
+
+
+def _install_fake_engines(monkeypatch, barrier=None, paddle_fails=False):
+    """Register fake easyocr/paddleocr modules; calls meet at barrier when given"""
+    seen = {}
+
+    class Reader:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def readtext(self, image):
+            seen['easyocr'] = threading.current_thread().name
+            seen['easyocr_shape'] = image.shape
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            return [(None, 'AB-12'), (None, 'C-3 ')]
+
+    class PaddleOCR:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def ocr(self, image, cls=True):
+            seen['paddleocr'] = threading.current_thread().name
+            seen['paddleocr_shape'] = image.shape
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            if paddle_fails:
+                raise RuntimeError("model crashed")
+            return [[(None, ('AB-12-C-3', 0.9))]]
+
+    monkeypatch.setitem(sys.modules, 'easyocr', types.SimpleNamespace(Reader=Reader))
+    monkeypatch.setitem(sys.modules, 'paddleocr', types.SimpleNamespace(PaddleOCR=PaddleOCR))
+    return seen
+
+
+def _config(**flags):
+    return replace(ExtractionConfig(), **flags)
+
+
+def test_both_engines_run_concurrently(monkeypatch):
+    # Each engine waits for the other, so this only finishes if they overlap
+    seen = _install_fake_engines(monkeypatch, barrier=threading.Barrier(2))
+    ocr = MultiEngineOCR(_config(use_easyocr=True, use_paddleocr=True))
+    try:
+        best, results = ocr.extract_with_voting(np.zeros((10, 10), np.uint8), 'AB-12-C-3')
+    finally:
+        ocr.close()
+
+    assert best == 'AB-12-C-3'
+    assert results == {'tesseract': 'AB-12-C-3', 'easyocr': 'AB-12 C-3', 'paddleocr': 'AB-12-C-3'}
+    assert seen['easyocr'] == threading.current_thread().name
+    assert seen['paddleocr'].startswith('MultiEngineOCR-Paddle')
+
+
+def test_single_engine_runs_inline_and_failures_are_dropped(monkeypatch):
+    seen = _install_fake_engines(monkeypatch, paddle_fails=True)
+    ocr = MultiEngineOCR(_config(use_paddleocr=True))
+
+    _, results = ocr.extract_with_voting(np.zeros((10, 10), np.uint8), 'X')
+
+    assert ocr._executor is None
+    assert results == {'tesseract': 'X'}
+    assert seen['paddleocr'] == threading.current_thread().name
+
+
+def test_engines_receive_the_full_resolution_image(monkeypatch):
+    # Both engines crop recognition boxes from the image they are given
+    seen = _install_fake_engines(monkeypatch)
+    ocr = MultiEngineOCR(_config(use_easyocr=True, use_paddleocr=True))
+    try:
+        ocr.extract_with_voting(np.zeros((4200, 6000), np.uint8), 'X')
+    finally:
+        ocr.close()
+
+    assert seen['easyocr_shape'] == seen['paddleocr_shape'] == (4200, 6000)
+
+
+def test_extract_batch_without_neural_engines_runs_inline():
+    ocr = MultiEngineOCR(_config())
+    images = [np.zeros((10, 10), np.uint8)] * 3
+
+    results = ocr.extract_batch(images, ['A', 'B', 'C'])
+
+    assert ocr._process_pool is None
+    assert results == [(t, {'tesseract': t}) for t in 'ABC']
+
+
+def test_extract_batch_rejects_mismatched_inputs():
+    with pytest.raises(ValueError):
+        MultiEngineOCR(_config()).extract_batch([np.zeros((10, 10), np.uint8)], [])
+
+
+def test_voting_worker_builds_its_engines_once(monkeypatch):
+    from v3.utils import ocr_enhancer
+
+    _install_fake_engines(monkeypatch)
+    monkeypatch.setattr(ocr_enhancer, '_worker_ocr', None)
+    ocr_enhancer._init_voting_worker(_config(use_easyocr=True))
+    worker_ocr = ocr_enhancer._worker_ocr
+
+    first = ocr_enhancer._vote_in_worker(np.zeros((10, 10), np.uint8), 'X')
+    second = ocr_enhancer._vote_in_worker(np.zeros((10, 10), np.uint8), 'Y')
+
+    assert ocr_enhancer._worker_ocr is worker_ocr
+    assert first == ('X', {'tesseract': 'X', 'easyocr': 'AB-12 C-3'})
+    assert second[0] == 'Y'
@@ -0,0 +1,62 @@
+"""OCREnhancer serial pattern correction tests."""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v3.utils.config_manager import ExtractionConfig
+from v3.utils.ocr_enhancer import OCREnhancer
+
+
+def test_lookalike_letters_in_serial_digits_are_corrected():
+    enhancer = OCREnhancer(ExtractionConfig())
+
+    assert enhancer.apply_pattern_correction("AB-12-C-3-XO1lIZo") == "AB-12-C-3-X011120"
+    # A leading letter is the serial prefix and is left alone
+    assert enhancer.apply_pattern_correction("AB-12-C-3-O1l") == "AB-12-C-3-O11"
+
+
+def test_clean_or_short_headers_are_returned_unchanged():
+    enhancer = OCREnhancer(ExtractionConfig())
+
+    text = "AB-12-C-3-X0123"
+    assert enhancer.apply_pattern_correction(text) is text
+    assert enhancer.apply_pattern_correction("AB-O-C") == "AB-O-C"
+    assert enhancer.apply_pattern_correction("Ol-Ol-Ol-O") == "Ol-Ol-Ol-O"
+
+
+def test_pattern_correction_can_be_disabled():
+    enhancer = OCREnhancer(replace(ExtractionConfig(), enable_pattern_correction=False))
+
+    assert enhancer.apply_pattern_correction("AB-12-C-3-XO1") == "AB-12-C-3-XO1"
+
+
+def test_batch_matches_per_text_correction():
+    enhancer = OCREnhancer(ExtractionConfig())
+    texts = ["AB-12-C-3-XO1lIZo", "AB-12-C-3-X0123", "", "Ol-Ol-Ol-O", "AB-O-C", "AB-12-C-3-O1l"]
+
+    assert enhancer.apply_pattern_correction_batch(iter(texts)) == [
+        enhancer.apply_pattern_correction(text) for text in texts
+    ]
+
+
+def test_batch_with_correction_disabled_returns_a_copy():
+    enhancer = OCREnhancer(replace(ExtractionConfig(), enable_pattern_correction=False))
+    texts = ["AB-12-C-3-XO1"]
+
+    result = enhancer.apply_pattern_correction_batch(texts)
+
+    assert result == texts and result is not texts
+
+
+def test_correction_is_logged_at_debug(caplog):
+    enhancer = OCREnhancer(ExtractionConfig())
+
+    with caplog.at_level("DEBUG", logger="v3.utils.ocr_enhancer"):
+        enhancer.apply_pattern_correction("AB-12-C-3-XO1")
+
+    assert "[PATTERN-CORRECT] 'XO1' → 'X01' (full: 'AB-12-C-3-XO1' → 'AB-12-C-3-X01')" in caplog.text
@@ -0,0 +1,46 @@
+"""OCREnhancer Tesseract command-line tests."""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytesseract
+
+from v3.utils.config_manager import ExtractionConfig
+from v3.utils.ocr_enhancer import OCREnhancer
+
+
+def test_config_string_is_unchanged():
+    config = replace(ExtractionConfig(), tesseract_psm_mode=6, tesseract_char_whitelist='AB-')
+
+    assert OCREnhancer(config).get_tesseract_config() == "--psm 6 --oem 3 -c tessedit_char_whitelist=AB-"
+    assert OCREnhancer(replace(config, tesseract_char_whitelist='')).get_tesseract_config() == "--psm 6 --oem 3"
+
+
+def test_batch_argv_lists_images_in_one_input_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(pytesseract.pytesseract, 'tesseract_cmd', 'C:/Tesseract/tesseract.exe')
+    config = replace(ExtractionConfig(), tesseract_char_whitelist='AB-', tesseract_lang='eng+tha')
+    paths = [str(tmp_path / "p1.png"), str(tmp_path / "p2.png")]
+
+    argv = OCREnhancer(config).get_tesseract_argv_batch(paths, str(tmp_path))
+
+    assert (tmp_path / "images.txt").read_text(encoding='utf-8').splitlines() == paths
+    assert argv == [
+        'C:/Tesseract/tesseract.exe', str(tmp_path / "images.txt"), str(tmp_path / "batch"),
+        '-l', 'eng+tha', '--psm', '7', '--oem', '3', '-c', 'tessedit_char_whitelist=AB-',
+        '-c', 'tessedit_create_txt=1',
+    ]
+
+
+def test_batch_argv_uses_the_resolved_command_and_default_language(tmp_path, monkeypatch):
+    monkeypatch.setattr(pytesseract.pytesseract, 'tesseract_cmd', '/opt/tesseract/bin/tesseract')
+    config = replace(ExtractionConfig(), tesseract_cmd='/stale/config/path/tesseract')
+
+    argv = OCREnhancer(config).get_tesseract_argv_batch([], str(tmp_path))
+
+    assert argv[0] == '/opt/tesseract/bin/tesseract'
+    assert argv[3:5] == ['-l', 'eng']
@@ -1,6 +1,7 @@
 """Tests for character-level O/0 refinement in OCR pipeline."""
 
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -26,9 +27,9 @@ class _ClassifierStub:
         }
 
 
-def _pipeline_stub() -> OCRPipeline:
+def _pipeline_stub(**config_overrides) -> OCRPipeline:
     pipeline = OCRPipeline.__new__(OCRPipeline)
-    pipeline.config = ConfigManager.load_from_file("v3/config.ini")
+    pipeline.config = replace(ConfigManager.load_from_file("v3/config.ini"), **config_overrides)
     pipeline.validator = HeaderValidator(pipeline.config)
     pipeline._zero_o_classifier = _ClassifierStub("O", True)
     pipeline._code_pair_map = OCRPipeline._build_bidirectional_pair_map(
@@ -38,9 +39,10 @@ def _pipeline_stub() -> OCRPipeline:
 
 
 def test_char_classifier_refines_internal_zero_to_o():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = True
-    pipeline.config.enable_code_glyph_width_fallback = False
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=True,
+        enable_code_glyph_width_fallback=False,
+    )
 
     # Header: B-FD-020H-S18020267 -> code starts at index 5, internal zero at index 7.
     pipeline._extract_char_boxes = lambda _text, _img: {7: (1, 1, 8, 8)}
@@ -64,10 +66,11 @@ def test_char_classifier_refines_internal_zero_to_o():
 
 
 def test_char_classifier_requires_min_vote_support():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = False
-    pipeline.config.enable_code_glyph_width_fallback = False
-    pipeline.config.code_char_classifier_min_vote_support = 2
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=False,
+        enable_code_glyph_width_fallback=False,
+        code_char_classifier_min_vote_support=2,
+    )
 
     pipeline._extract_char_boxes = lambda _text, _img: {7: (1, 1, 8, 8)}
     pipeline._crop_char = lambda _img, _box: object()
@@ -85,10 +88,11 @@ def test_char_classifier_requires_min_vote_support():
 
 
 def test_char_classifier_does_not_flip_leading_zero():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = True
-    pipeline.config.enable_code_glyph_width_fallback = False
-    pipeline.config.code_char_classifier_allow_leading_zero_to_o = False
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=True,
+        enable_code_glyph_width_fallback=False,
+        code_char_classifier_allow_leading_zero_to_o=False,
+    )
 
     # Only leading zero has box evidence; it must remain numeric.
     pipeline._extract_char_boxes = lambda _text, _img: {5: (1, 1, 8, 8)}
@@ -105,9 +109,10 @@ def test_char_classifier_does_not_flip_leading_zero():
 
 
 def test_char_classifier_falls_back_to_width_rule_when_no_boxes():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = True
-    pipeline.config.enable_code_glyph_width_fallback = True
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=True,
+        enable_code_glyph_width_fallback=True,
+    )
 
     pipeline._extract_char_boxes = lambda _text, _img: {}
     pipeline._refine_code_zero_o_with_glyph_width = lambda _text, _img: (
@@ -125,10 +130,11 @@ def test_char_classifier_falls_back_to_width_rule_when_no_boxes():
 
 
 def test_char_classifier_handles_uei_uel_pair():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = False
-    pipeline.config.enable_code_glyph_width_fallback = False
-    pipeline.config.code_ambiguity_pairs = "O:0,I:L"
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=False,
+        enable_code_glyph_width_fallback=False,
+        code_ambiguity_pairs="O:0,I:L",
+    )
     pipeline._code_pair_map = OCRPipeline._build_bidirectional_pair_map(
         pipeline.config.code_ambiguity_pairs
     )
@@ -148,11 +154,12 @@ def test_char_classifier_handles_uei_uel_pair():
 
 
 def test_image_support_rescue_resolves_uei_uel_when_classifier_no_change():
-    pipeline = _pipeline_stub()
-    pipeline.config.enable_code_char_classifier = False
-    pipeline.config.enable_code_glyph_width_fallback = False
-    pipeline.config.enable_code_image_support_rescue = True
-    pipeline.config.code_ambiguity_pairs = "O:0,I:L"
+    pipeline = _pipeline_stub(
+        enable_code_char_classifier=False,
+        enable_code_glyph_width_fallback=False,
+        enable_code_image_support_rescue=True,
+        code_ambiguity_pairs="O:0,I:L",
+    )
     pipeline._code_pair_map = OCRPipeline._build_bidirectional_pair_map(
         pipeline.config.code_ambiguity_pairs
     )
@@ -1,6 +1,7 @@
 """Tests for OCR method-level stability and early-exit behavior."""
 
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 from PIL import Image
@@ -15,9 +16,9 @@ from v3.utils.config_manager import ConfigManager
 from v3.utils.ocr_context import OCRContext
 
 
-def _pipeline_stub() -> OCRPipeline:
+def _pipeline_stub(**config_overrides) -> OCRPipeline:
     pipeline = OCRPipeline.__new__(OCRPipeline)
-    pipeline.config = ConfigManager.load_from_file("v3/config.ini")
+    pipeline.config = replace(ConfigManager.load_from_file("v3/config.ini"), **config_overrides)
     pipeline.validator = HeaderValidator(pipeline.config)
     pipeline._tesseract_available = True
     pipeline._get_tesseract_configs = lambda: [(7, "--psm 7 --oem 3")]
@@ -25,12 +26,13 @@ def _pipeline_stub() -> OCRPipeline:
 
 
 def test_run_ocr_methods_waits_for_repeated_strong_result():
-    pipeline = _pipeline_stub()
-    pipeline.config.max_ocr_attempts = 4
-    pipeline.config.early_exit_score = 90
-    pipeline.config.tesseract_confidence_threshold = 82.0
-    pipeline.config.ocr_method_early_exit_min_attempts = 2
-    pipeline.config.ocr_method_early_exit_min_confirmations = 2
+    pipeline = _pipeline_stub(
+        max_ocr_attempts=4,
+        early_exit_score=90,
+        tesseract_confidence_threshold=82.0,
+        ocr_method_early_exit_min_attempts=2,
+        ocr_method_early_exit_min_confirmations=2,
+    )
 
     # First method is wrong but still "excellent"; next two agree on the correct value.
     pipeline._method2_threshold = lambda _gray, _cfg, _ctx: ("B-TW-UEL-S18011737", 202, 95.0)
@@ -0,0 +1,154 @@
+"""PDFHandler seen-set, missed-file recovery and ObserverHealthProbe tests."""
+
+import importlib
+import logging
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+class _FakeExtractor:
+    def __init__(self):
+        self.processed = []
+
+    def process_pdf(self, path):
+        self.processed.append(path)
+        return {'success': True}
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    # The module configures file logging under ./logs on import
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: None)
+    return importlib.import_module("v3.pdf_watcher_v3")
+
+
+class _FakeObserver:
+    def __init__(self, alive=True, timeout=None):
+        self.alive = alive
+        self.scheduled = []
+        self.stopped = False
+
+    def is_alive(self):
+        return self.alive
+
+    def schedule(self, handler, path, recursive=False):
+        self.scheduled.append(path)
+
+    def start(self):
+        self.alive = True
+
+    def stop(self):
+        self.stopped = True
+
+    def join(self, timeout=None):
+        pass
+
+
+class _FakePollingObserver(_FakeObserver):
+    pass
+
+
+def _probe(watcher, monkeypatch, handler, folder, observer):
+    monkeypatch.setattr(watcher, "PollingObserver", _FakePollingObserver)
+    return watcher.ObserverHealthProbe(handler, observer, folder, poll_timeout=1.0, max_misses=2)
+
+
+def _handler(watcher, monkeypatch, ready):
+    monkeypatch.setattr(watcher.PDFHandler, "_wait_for_file_ready", lambda self, path: ready[0])
+    return watcher.PDFHandler(_FakeExtractor(), metrics=None)
+
+
+def test_file_not_ready_is_retried_once_it_changes(watcher, monkeypatch, tmp_path):
+    ready = [False]
+    handler = _handler(watcher, monkeypatch, ready)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"partial")
+
+    handler.on_created(SimpleNamespace(is_directory=False, src_path=str(pdf)))
+
+    assert str(pdf) not in handler.seen
+    assert handler.find_missed(tmp_path) == ([], [])  # Unchanged since the failed check
+
+    pdf.write_bytes(b"partial, now complete")
+    ready[0] = True
+    assert handler.find_missed(tmp_path) == ([], [str(pdf)])
+
+    handler.process_missed(str(pdf))
+    assert handler.extractor.processed == [str(pdf)]
+    assert str(pdf) in handler.seen
+    assert handler.find_missed(tmp_path) == ([], [])
+
+
+def test_move_forgets_source_and_processes_destination(watcher, monkeypatch, tmp_path):
+    handler = _handler(watcher, monkeypatch, [True])
+    old, new = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    new.write_bytes(b"pdf")
+    handler.seen.add(str(old))
+
+    handler.on_moved(SimpleNamespace(is_directory=False, src_path=str(old), dest_path=str(new)))
+
+    assert handler.seen == {str(new)}
+    assert handler.extractor.processed == [str(new)]
+
+    # The same name dropped again is processed again
+    handler.on_moved(SimpleNamespace(is_directory=False, src_path=str(new), dest_path=str(tmp_path / "b.tmp")))
+    handler.on_created(SimpleNamespace(is_directory=False, src_path=str(new)))
+    assert handler.extractor.processed == [str(new), str(new)]
+
+
+def test_probe_falls_back_to_polling_after_consecutive_misses(watcher, monkeypatch, tmp_path):
+    handler = _handler(watcher, monkeypatch, [True])
+    native = _FakeObserver()
+    probe = _probe(watcher, monkeypatch, handler, tmp_path, native)
+
+    (tmp_path / "a.pdf").write_bytes(b"pdf")
+    probe.probe()
+    assert probe.consecutive_misses == 1 and probe.observer is native
+
+    (tmp_path / "b.pdf").write_bytes(b"pdf")
+    probe.probe()
+    assert probe.using_polling and native.stopped
+    assert probe.observer.scheduled == [str(tmp_path)]
+    assert handler.extractor.processed == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+
+    probe.probe()
+    assert probe.consecutive_misses == 0 and probe.total_missed == 2
+
+
+def test_probe_retries_not_ready_files_without_counting_misses(watcher, monkeypatch, tmp_path):
+    ready = [False]
+    handler = _handler(watcher, monkeypatch, ready)
+    native = _FakeObserver()
+    probe = _probe(watcher, monkeypatch, handler, tmp_path, native)
+    pdf = tmp_path / "slow.pdf"
+    pdf.write_bytes(b"1")
+    handler.on_created(SimpleNamespace(is_directory=False, src_path=str(pdf)))
+
+    # Still copying: the file keeps changing and keeps failing the ready check
+    for chunk in (b"12", b"123", b"1234"):
+        pdf.write_bytes(chunk)
+        probe.probe()
+    assert probe.consecutive_misses == 0 and probe.total_missed == 0
+    assert probe.observer is native and not native.stopped
+
+    pdf.write_bytes(b"12345")
+    ready[0] = True
+    probe.probe()
+    assert handler.extractor.processed == [str(pdf)]
+
+
+def test_probe_replaces_a_dead_native_observer(watcher, monkeypatch, tmp_path):
+    handler = _handler(watcher, monkeypatch, [True])
+    probe = _probe(watcher, monkeypatch, handler, tmp_path, _FakeObserver(alive=False))
+
+    probe.probe()
+
+    assert probe.using_polling and probe.consecutive_misses == 0
@@ -51,15 +51,17 @@ class FallbackChecker:
             enable_pattern_check: Enable/disable pattern validation
         """
         # ถ้าให้ ExtractionConfig มา ให้ใช้ค่าจาก config
+        compiled_pattern = None
         if config is not None and hasattr(config, 'tesseract_confidence_threshold'):
             confidence_threshold = config.tesseract_confidence_threshold
             header_pattern = config.header_pattern
             character_whitelist = config.character_whitelist
             ambiguous_characters = config.ambiguous_characters
             enable_pattern_check = config.enable_pattern_check
+            compiled_pattern = getattr(config, 'compiled_header_pattern', None)
 
         self.confidence_threshold = confidence_threshold
-        self.pattern = re.compile(header_pattern)
+        self.pattern = compiled_pattern or re.compile(header_pattern)
         self.whitelist = set(character_whitelist)
         self.enable_pattern_check = enable_pattern_check
         self.ambiguous_chars = self._parse_ambiguous(ambiguous_characters)
@@ -23,8 +23,10 @@ class HeaderValidator:
 
     def __init__(self, config: ExtractionConfig):
         self.config = config
-        self._ambiguous_map = self._parse_ambiguous_map(config.ambiguous_characters)
-        self._header_pattern = re.compile(config.header_pattern) if config.header_pattern else None
+        self._ambiguous_map = dict(config.ambiguous_pairs_tuple)
+        self._code_ambiguity_map = self._bidirectional_pair_map(config.code_ambiguity_pairs_tuple)
+        self._allowed_chars = config.whitelist_set.union(config.expected_separator)
+        self._header_pattern = config.compiled_header_pattern
 
     def validate_and_score(self, text: str) -> Tuple[int, str]:
         """
@@ -141,7 +143,7 @@ class HeaderValidator:
         s = re.sub(r"\s+", "", s)
 
         # Keep only configured whitelist and separator.
-        allowed = set(self.config.character_whitelist + self.config.expected_separator)
+        allowed = self._allowed_chars
         s = "".join(ch for ch in s if ch in allowed)
 
         # Collapse duplicated separators and trim ends.
@@ -197,7 +199,7 @@ class HeaderValidator:
         return prefix + normalized
 
     def _has_only_allowed_chars(self, text: str) -> bool:
-        allowed = set(self.config.character_whitelist + self.config.expected_separator)
+        allowed = self._allowed_chars
         return all(ch in allowed for ch in text)
 
     def _score_structure(self, parts) -> int:
@@ -356,25 +358,6 @@ class HeaderValidator:
         ratio = SequenceMatcher(None, digits_a, digits_b).ratio()
         return ratio >= self.config.serial_close_match_threshold
 
-    def _parse_ambiguous_map(self, mapping: str) -> Dict[str, str]:
-        """
-        Parse config map like: 'S:5,B:8,P:F,O:0,I:1,Z:2'
-        """
-        result: Dict[str, str] = {}
-        if not mapping:
-            return result
-
-        for pair in mapping.split(","):
-            token = pair.strip()
-            if ":" not in token:
-                continue
-            src, dst = token.split(":", 1)
-            src = src.strip().upper()
-            dst = dst.strip().upper()
-            if len(src) == 1 and len(dst) == 1:
-                result[src] = dst
-        return result
-
     def inspect_code_ambiguity(self, text: str) -> Dict[str, object]:
         """
         Inspect OCR ambiguity in customer code segment (observe-only).
@@ -390,7 +373,7 @@ class HeaderValidator:
             - note
         """
         result: Dict[str, object] = {
-            "enabled": bool(getattr(self.config, "enable_code_ambiguity_monitor", True)),
+            "enabled": bool(self.config.enable_code_ambiguity_monitor),
             "is_ambiguous": False,
             "normalized_header": "",
             "code_segment": "",
@@ -422,9 +405,7 @@ class HeaderValidator:
             result["note"] = "empty_code"
             return result
 
-        pairs = self._parse_bidirectional_ambiguity_pairs(
-            getattr(self.config, "code_ambiguity_pairs", "O:0,I:L")
-        )
+        pairs = self._code_ambiguity_map
         if not pairs:
             result["note"] = "no_pairs"
             return result
@@ -434,12 +415,12 @@ class HeaderValidator:
             result["note"] = "no_variant"
             return result
 
-        only_mixed = bool(getattr(self.config, "code_ambiguity_only_mixed_alnum", True))
+        only_mixed = bool(self.config.code_ambiguity_only_mixed_alnum)
         has_alpha = any(ch.isalpha() for ch in code)
         has_digit = any(ch.isdigit() for ch in code)
         if only_mixed and not (has_alpha and has_digit):
             allow_same_type = bool(
-                getattr(self.config, "code_ambiguity_allow_same_type_pairs", True)
+                self.config.code_ambiguity_allow_same_type_pairs
             )
             if not allow_same_type:
                 result["note"] = "not_mixed_alnum"
@@ -503,24 +484,14 @@ class HeaderValidator:
             variants.append(variant)
         return variants
 
-    def _parse_bidirectional_ambiguity_pairs(self, mapping: str) -> Dict[str, str]:
+    @staticmethod
+    def _bidirectional_pair_map(pair_tuples: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
         """
-        Parse ambiguity map and make it bidirectional.
+        Make pre-parsed ambiguity pairs bidirectional.
         Example: O:0 -> O->0 and 0->O
         """
         pairs: Dict[str, str] = {}
-        if not mapping:
-            return pairs
-
-        for token in mapping.split(","):
-            raw = token.strip().upper()
-            if ":" not in raw:
-                continue
-            left, right = raw.split(":", 1)
-            left = left.strip()
-            right = right.strip()
-            if len(left) != 1 or len(right) != 1:
-                continue
+        for left, right in pair_tuples:
             pairs[left] = right
             pairs[right] = left
         return pairs
@@ -70,17 +70,17 @@ class OCRPipeline:
         self._paddle_cooldown_seconds = 600
         self._paddle_disabled_until = 0.0
         self._zero_o_classifier = ZeroOCharClassifier(
-            enabled=bool(getattr(config, "enable_code_char_classifier", True)),
-            min_confidence=float(getattr(config, "code_char_classifier_min_confidence", 0.72)),
-            min_margin=float(getattr(config, "code_char_classifier_min_margin", 0.12)),
+            enabled=bool(config.enable_code_char_classifier),
+            min_confidence=float(config.code_char_classifier_min_confidence),
+            min_margin=float(config.code_char_classifier_min_margin),
         )
         box_alignment_pairs = self._merge_pair_specs(
-            str(getattr(config, "code_box_alignment_ambiguity_pairs", "O:0,S:5,F:E")),
-            str(getattr(config, "code_ambiguity_pairs", "O:0,I:L")),
+            str(config.code_box_alignment_ambiguity_pairs),
+            str(config.code_ambiguity_pairs),
         )
         self._box_alignment_map = self._build_box_alignment_map(box_alignment_pairs)
         self._code_pair_map = self._build_bidirectional_pair_map(
-            str(getattr(config, "code_ambiguity_pairs", "O:0,I:L"))
+            str(config.code_ambiguity_pairs)
         )
 
         logger.info("OCR Pipeline V3.2 initialized (native V3 methods + PaddleOCR fallback)")
@@ -317,8 +317,8 @@ class OCRPipeline:
                     score=score
                 )
             force_multi_scale_for_ambiguity = (
-                bool(getattr(self.config, "code_autocorrect_force_multi_scale", True))
-                and bool(getattr(self.config, "enable_code_ambiguity_autocorrect", True))
+                bool(self.config.code_autocorrect_force_multi_scale)
+                and bool(self.config.enable_code_ambiguity_autocorrect)
                 and code_ambiguous
             )
 
@@ -358,10 +358,10 @@ class OCRPipeline:
                 f"(score: {best_score}, strict_valid: {voted['strict_valid']}, scale: {voted['scale']}x)"
             )
 
-            if bool(getattr(self.config, "enable_code_ambiguity_autocorrect", True)):
-                min_support = int(getattr(self.config, "code_autocorrect_min_support", 1))
+            if bool(self.config.enable_code_ambiguity_autocorrect):
+                min_support = int(self.config.code_autocorrect_min_support)
                 require_evidence = bool(
-                    getattr(self.config, "code_autocorrect_require_scale_evidence", True)
+                    self.config.code_autocorrect_require_scale_evidence
                 )
                 resolved_text, resolve_meta = self.validator.resolve_code_ambiguity_by_support(
                     best_text,
@@ -398,10 +398,10 @@ class OCRPipeline:
                 best_score, best_text = self.validator.validate_and_score(best_text)
 
         disambiguation_img = img
-        if bool(getattr(self.config, "enable_code_ambiguity_confirm_high_scale", True)) and best_text:
+        if bool(self.config.enable_code_ambiguity_confirm_high_scale) and best_text:
             ambiguity = self.validator.inspect_code_ambiguity(best_text)
             if ambiguity.get("is_ambiguous"):
-                confirm_scale = float(getattr(self.config, "code_ambiguity_confirm_scale", self.config.max_render_scale))
+                confirm_scale = float(self.config.code_ambiguity_confirm_scale)
                 if confirm_scale > 0 and selected_scale + 1e-6 < confirm_scale:
                     try:
                         logger.info(
@@ -413,7 +413,7 @@ class OCRPipeline:
                     except Exception as e:
                         logger.warning(f"[OCR] Ambiguity confirm render failed at {confirm_scale}x: {e}")
 
-        if bool(getattr(self.config, "enable_code_glyph_disambiguation", True)) and best_text:
+        if bool(self.config.enable_code_glyph_disambiguation) and best_text:
             refined_text, reason = self._refine_code_zero_o_with_char_classifier(
                 best_text,
                 disambiguation_img,
@@ -433,7 +433,7 @@ class OCRPipeline:
                 all_method_results["__meta__"]["glyph_disambiguation_reason"] = reason
                 logger.info(f"[OCR] Code glyph disambiguation skipped: {reason}")
 
-        if bool(getattr(self.config, "enable_code_ambiguity_full_ocr_confirm", True)) and best_text:
+        if bool(self.config.enable_code_ambiguity_full_ocr_confirm) and best_text:
             ambiguity = self.validator.inspect_code_ambiguity(best_text)
             all_method_results.setdefault("__meta__", {})
             glyph_reason = str(all_method_results["__meta__"].get("glyph_disambiguation_reason", "") or "")
@@ -452,7 +452,7 @@ class OCRPipeline:
                     confirm_support = self._count_non_empty_method_results(confirm_method_results)
                     min_support = max(
                         1,
-                        int(getattr(self.config, "code_ambiguity_full_ocr_confirm_min_support", 2)),
+                        int(self.config.code_ambiguity_full_ocr_confirm_min_support),
                     )
                     should_apply = False
                     apply_reason = ""
@@ -468,7 +468,7 @@ class OCRPipeline:
                             "no_votes" in glyph_reason
                             and confirm_support >= min_support
                             and selected_scale + 1e-6 < float(
-                                getattr(self.config, "code_ambiguity_confirm_scale", self.config.max_render_scale)
+                                self.config.code_ambiguity_confirm_scale
                             )
                         ):
                             should_apply = True
@@ -540,7 +540,7 @@ class OCRPipeline:
         except Exception:
             return base_header, "rescue_import_failed"
 
-        rescue_scale = float(getattr(self.config, "code_anchor_rescue_scale", 7.5))
+        rescue_scale = float(self.config.code_anchor_rescue_scale)
         try:
             logger.info(
                 f"[OCR] Rescue pass: render {rescue_scale}x for page {context.page_num}"
@@ -600,21 +600,21 @@ class OCRPipeline:
             return header_text, "offset_not_found"
         code_start, _code_end = offsets[code_idx]
         char_widths = self._extract_char_widths(header_text, image)
-        zero_width_threshold = float(getattr(self.config, "code_zero_to_o_width_ratio", 1.12))
+        zero_width_threshold = float(self.config.code_zero_to_o_width_ratio)
 
         char_boxes = self._extract_char_boxes(header_text, image)
         if not char_boxes:
-            if bool(getattr(self.config, "enable_code_glyph_width_fallback", True)):
+            if bool(self.config.enable_code_glyph_width_fallback):
                 return self._refine_code_zero_o_with_glyph_width(header_text, image)
             return header_text, "no_char_boxes"
 
-        allow_leading = bool(getattr(self.config, "code_char_classifier_allow_leading_zero_to_o", False))
+        allow_leading = bool(self.config.code_char_classifier_allow_leading_zero_to_o)
         updated = list(code)
         changed = False
         notes: List[str] = []
         skip_stats: Dict[str, int] = defaultdict(int)
 
-        max_positions = max(1, int(getattr(self.config, "code_char_classifier_max_positions", 4)))
+        max_positions = max(1, int(self.config.code_char_classifier_max_positions))
         inspected = 0
 
         for code_pos, ch in enumerate(code):
@@ -654,7 +654,7 @@ class OCRPipeline:
 
             if (
                 pair_key == frozenset({"0", "O"})
-                and bool(getattr(self.config, "code_char_classifier_enable_width_vote", True))
+                and bool(self.config.code_char_classifier_enable_width_vote)
             ):
                 zero_positions = [i for i, c in enumerate(code) if c == "0"]
                 if len(zero_positions) >= 2:
@@ -672,7 +672,7 @@ class OCRPipeline:
                                 votes["O"] += 1
                                 vote_notes.append(f"width=O@{ratio:.2f}")
 
-            if pair_key == frozenset({"0", "O"}) and bool(getattr(self.config, "enable_code_char_classifier", True)):
+            if pair_key == frozenset({"0", "O"}) and bool(self.config.enable_code_char_classifier):
                 pred = self._zero_o_classifier.predict(glyph)
                 if pred and pred.get("accepted"):
                     predicted = str(pred.get("predicted_char", ""))
@@ -711,7 +711,7 @@ class OCRPipeline:
                 continue
             min_vote_support = max(
                 1,
-                int(getattr(self.config, "code_char_classifier_min_vote_support", 2)),
+                int(self.config.code_char_classifier_min_vote_support),
             )
             if predicted_votes < min_vote_support:
                 skip_stats["below_min_support"] += 1
@@ -726,14 +726,14 @@ class OCRPipeline:
         if changed:
             parts[code_idx] = "".join(updated)
             refined = self.config.expected_separator.join(parts)
-            if bool(getattr(self.config, "code_char_classifier_require_evidence", False)):
+            if bool(self.config.code_char_classifier_require_evidence):
                 support = self._count_header_support(refined, evidence_headers or [])
-                required = max(1, int(getattr(self.config, "code_char_classifier_min_evidence_support", 1)))
+                required = max(1, int(self.config.code_char_classifier_min_evidence_support))
                 if support < required:
                     return header_text, f"insufficient_evidence({support}<{required})"
             return refined, "classifier(" + ",".join(notes[:3]) + ")"
 
-        if bool(getattr(self.config, "enable_code_image_support_rescue", True)):
+        if bool(self.config.enable_code_image_support_rescue):
             resolved, resolve_reason = self._resolve_code_ambiguity_by_image_support(
                 header_text=header_text,
                 image=image,
@@ -742,7 +742,7 @@ class OCRPipeline:
             if resolved != header_text:
                 return resolved, resolve_reason
 
-        if bool(getattr(self.config, "enable_code_glyph_width_fallback", True)):
+        if bool(self.config.enable_code_glyph_width_fallback):
             return self._refine_code_zero_o_with_glyph_width(header_text, image)
         if skip_stats:
             parts = [f"{key}={value}" for key, value in sorted(skip_stats.items()) if value > 0]
@@ -845,7 +845,7 @@ class OCRPipeline:
         if len(whitelist) < 2:
             return {}, []
 
-        min_conf = float(getattr(self.config, "code_char_tesseract_confidence_threshold", 72.0))
+        min_conf = float(self.config.code_char_tesseract_confidence_threshold)
         votes: Dict[str, int] = {ch: 0 for ch in whitelist}
         notes: List[str] = []
 
@@ -858,7 +858,7 @@ class OCRPipeline:
             for psm in psm_modes:
                 config = f"--psm {psm} --oem 3 -c tessedit_char_whitelist={whitelist}"
                 try:
-                    text = pytesseract.image_to_string(variant, lang="eng", config=config).strip().upper()
+                    text = pytesseract.image_to_string(variant, lang=self.config.tesseract_lang, config=config).strip().upper()
                 except Exception:
                     continue
                 if not text:
@@ -871,7 +871,7 @@ class OCRPipeline:
                 try:
                     data = pytesseract.image_to_data(
                         variant,
-                        lang="eng",
+                        lang=self.config.tesseract_lang,
                         config=config,
                         output_type=pytesseract.Output.DICT,
                     )
@@ -919,7 +919,7 @@ class OCRPipeline:
         if not candidates:
             return header_text, "image_support_no_candidates"
 
-        min_support = max(1, int(getattr(self.config, "code_image_support_min_votes", 1)))
+        min_support = max(1, int(self.config.code_image_support_min_votes))
         resolved, meta = self.validator.resolve_code_ambiguity_by_support(
             header_text,
             candidates,
@@ -963,7 +963,7 @@ class OCRPipeline:
         ]
         psm_modes = [7, 6, 13]
         whitelist = self.config.tesseract_char_whitelist or "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"
-        max_attempts = max(1, int(getattr(self.config, "code_image_support_max_attempts", 6)))
+        max_attempts = max(1, int(self.config.code_image_support_max_attempts))
 
         candidates: List[str] = []
         attempts = 0
@@ -971,7 +971,7 @@ class OCRPipeline:
             for psm in psm_modes:
                 config = f"--psm {psm} --oem 3 -c tessedit_char_whitelist={whitelist}"
                 try:
-                    text = pytesseract.image_to_string(variant, lang="eng", config=config).strip().upper()
+                    text = pytesseract.image_to_string(variant, lang=self.config.tesseract_lang, config=config).strip().upper()
                 except Exception:
                     continue
                 if text:
@@ -1046,7 +1046,7 @@ class OCRPipeline:
             return header_text, "insufficient_mapped_zeros"
 
         min_width = min(w for _, w in zero_widths)
-        threshold = float(getattr(self.config, "code_zero_to_o_width_ratio", 1.12))
+        threshold = float(self.config.code_zero_to_o_width_ratio)
         updated = list(code)
         changed = False
         for pos, width in zero_widths:
@@ -1120,7 +1120,7 @@ class OCRPipeline:
             if cfg not in configs:
                 configs.append(cfg)
 
-        min_ratio = max(0.05, float(getattr(self.config, "code_box_alignment_min_match_ratio", 0.35)))
+        min_ratio = max(0.05, float(self.config.code_box_alignment_min_match_ratio))
         best_boxes: Dict[int, Tuple[int, int, int, int]] = {}
         best_ratio = 0.0
         target = header_text.strip()
@@ -1128,7 +1128,7 @@ class OCRPipeline:
 
         for custom_config in configs:
             try:
-                boxes_str = pytesseract.image_to_boxes(bin_img, lang="eng", config=custom_config)
+                boxes_str = pytesseract.image_to_boxes(bin_img, lang=self.config.tesseract_lang, config=custom_config)
             except Exception:
                 continue
             if not boxes_str:
@@ -1293,7 +1293,7 @@ class OCRPipeline:
         gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
         h, w = gray.shape[:2]
 
-        pad_ratio = float(getattr(self.config, "code_char_box_padding_ratio", 0.18))
+        pad_ratio = float(self.config.code_char_box_padding_ratio)
         pad = max(1, int(max(x2 - x1, y2 - y1) * pad_ratio))
 
         xx1 = max(0, x1 - pad)
@@ -1565,7 +1565,7 @@ class OCRPipeline:
         """Run OCR and estimate confidence from Tesseract per-token data."""
         import pytesseract
 
-        text = pytesseract.image_to_string(image, lang="eng", config=custom_config).strip()
+        text = pytesseract.image_to_string(image, lang=self.config.tesseract_lang, config=custom_config).strip()
         if not text:
             return "", 0.0
 
@@ -1573,7 +1573,7 @@ class OCRPipeline:
         try:
             data = pytesseract.image_to_data(
                 image,
-                lang="eng",
+                lang=self.config.tesseract_lang,
                 config=custom_config,
                 output_type=pytesseract.Output.DICT,
             )
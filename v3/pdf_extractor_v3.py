@@ -78,7 +78,8 @@ class PDFTextExtractorV3:
             base_folder=config.debug_images_folder,
             organize_by_date=config.organize_by_date,
             retention_days=config.image_retention_days,
-            enabled=config.save_debug_images
+            enabled=config.save_debug_images,
+            debug_format=config.debug_image_format
         )
         self.output_organizer = OutputOrganizer(
             base_output_dir=config.output_base_dir,
@@ -148,7 +149,7 @@ class PDFTextExtractorV3:
             logger.info(f"[JOB {job_id}] Total pages: {total_pages}")
             
             # Determine which pages to read
-            if not self.config.pages_to_read:  # Empty list means 'all'
+            if not self.config.pages_to_read:  # Empty tuple means 'all'
                 pages_to_process = list(range(1, total_pages + 1))
                 logger.info(f"[JOB {job_id}] Reading all pages (1-{total_pages})")
             else:
@@ -232,7 +233,7 @@ class PDFTextExtractorV3:
                             "code_anchor_rescued",
                         )
 
-            if bool(getattr(self.config, "enable_code_anchor_harmonize", False)):
+            if bool(self.config.enable_code_anchor_harmonize):
                 # Optional post-pass harmonization, disabled by default to avoid
                 # cross-page over-correction in mixed/random batches.
                 page_headers, header_updates = self._harmonize_code_ambiguity_headers(
@@ -547,7 +548,7 @@ class PDFTextExtractorV3:
         canonical_by_anchor = {}
         min_glyph_support = max(
             1,
-            int(getattr(self.config, "code_anchor_harmonize_min_glyph_support", 1)),
+            int(self.config.code_anchor_harmonize_min_glyph_support),
         )
         for anchor, code_map in variants_by_anchor.items():
             if len(code_map) <= 1:
@@ -620,7 +621,7 @@ class PDFTextExtractorV3:
         """
         if not page_headers:
             return page_headers, {}
-        if not bool(getattr(self.config, "enable_code_anchor_rescue_pass", True)):
+        if not bool(self.config.enable_code_anchor_rescue_pass):
             return page_headers, {}
 
         normalized_cache = {}
@@ -649,7 +650,7 @@ class PDFTextExtractorV3:
 
         updates = {}
         rescue_only_no_boxes = bool(
-            getattr(self.config, "code_anchor_rescue_only_on_no_char_boxes", True)
+            self.config.code_anchor_rescue_only_on_no_char_boxes
         )
 
         for anchor, items in anchors.items():
@@ -759,6 +760,9 @@ class PDFTextExtractorV3:
         if hasattr(self, 'extraction_logger'):
             self.extraction_logger.shutdown()
         
+        # Write out queued debug images
+        self.debug_manager.close()
+        
         # Export final metrics
         if self.metrics_tracker:
             self.metrics_tracker.export_to_json(self.config.metrics_export_path)
@@ -7,10 +7,13 @@ import os
 import sys
 import time
 import logging
+import threading
 from pathlib import Path
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 from datetime import datetime
+from typing import Optional
 
 # Ensure workspace root is on sys.path so `import v3` works when running
 # this file directly (e.g. `python v3\pdf_watcher_v3.py`)
@@ -45,14 +48,43 @@ def setup_logging():
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Longest shutdown waits for the health probe (it may be mid process_pdf)
+_PROBE_JOIN_TIMEOUT = 30.0
+
+
+def _scan_pdfs(folder: Path) -> set:
+    """Return paths of PDF files currently in folder (non-recursive)"""
+    with os.scandir(folder) as entries:
+        return {
+            entry.path for entry in entries
+            if entry.name.lower().endswith('.pdf') and entry.is_file()
+        }
+
+
+def _file_signature(path: str) -> Optional[tuple]:
+    """(size, mtime_ns) of path, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
 
 class PDFHandler(FileSystemEventHandler):
     """Handler for PDF file events"""
     
+    # FileSystemEventHandler defines no __slots__, so instances still get a
+    # __dict__; declaring ours keeps the handler's own state out of it.
+    __slots__ = ('extractor', 'metrics', 'processing', 'seen', 'not_ready', '_lock', '_process_lock')
+    
     def __init__(self, extractor: PDFTextExtractorV3, metrics: MetricsTracker):
         self.extractor = extractor
         self.metrics = metrics
         self.processing = set()
+        self.seen = set()  # Paths that passed the ready check (or were present at startup)
+        self.not_ready = {}  # Path -> (size, mtime_ns) when it last failed the ready check
+        self._lock = threading.Lock()
+        self._process_lock = threading.Lock()  # Observer and health probe share the extractor
     
     def on_created(self, event):
         """Handle file creation event"""
@@ -62,35 +94,99 @@ class PDFHandler(FileSystemEventHandler):
         if not event.src_path.lower().endswith('.pdf'):
             return
         
-        # Avoid duplicate processing
-        if event.src_path in self.processing:
+        self._handle_pdf(event.src_path)
+    
+    def on_deleted(self, event):
+        """Forget deleted files so a re-dropped file with the same name is processed again"""
+        if not event.is_directory:
+            self._forget(event.src_path)
+    
+    def on_moved(self, event):
+        """Forget the old name; a PDF renamed/moved into place is handled like a new file"""
+        if event.is_directory:
             return
         
+        self._forget(event.src_path)
+        if event.dest_path.lower().endswith('.pdf'):
+            self._handle_pdf(event.dest_path, source="Detected moved PDF")
+    
+    def process_missed(self, pdf_path: str):
+        """Process a PDF whose watcher event was lost (see find_missed)"""
+        self._handle_pdf(pdf_path, source="Recovered missed PDF")
+    
+    def _forget(self, pdf_path: str):
+        with self._lock:
+            self.seen.discard(pdf_path)
+            self.not_ready.pop(pdf_path, None)
+    
+    def mark_existing(self, folder: Path):
+        """Mark PDFs already in folder as seen (they are not processed on startup)"""
+        existing = _scan_pdfs(folder)
+        with self._lock:
+            self.seen.update(existing)
+    
+    def find_missed(self, folder: Path) -> tuple:
+        """
+        Return (missed, retries): PDFs in folder that were never processed
+        
+        missed are files no event was ever handled for (lost watcher events).
+        retries are files that failed the ready check and have changed since
+        (e.g. a slow copy still in progress or since finished); their event
+        arrived, so they are not evidence of a failing observer.
+        """
+        current = _scan_pdfs(folder)
+        with self._lock:
+            self.seen &= current  # Drop files that have left the folder
+            for gone in self.not_ready.keys() - current:
+                del self.not_ready[gone]
+            candidates = current - self.seen - self.processing
+            rejected = {path: sig for path, sig in self.not_ready.items() if path in candidates}
+        
+        missed = sorted(candidates - rejected.keys())
+        retries = sorted(path for path, sig in rejected.items() if _file_signature(path) != sig)
+        return missed, retries
+    
+    def _handle_pdf(self, pdf_path: str, source: str = "Detected new PDF"):
+        """Validate and process one PDF, skipping paths already handled"""
+        # Avoid duplicate processing
+        with self._lock:
+            if pdf_path in self.processing or pdf_path in self.seen:
+                return
+            self.processing.add(pdf_path)
+        
         try:
-            self.processing.add(event.src_path)
-            logger.info(f"Detected new PDF: {event.src_path}")
+            logger.info(f"{source}: {pdf_path}")
             
-            # Wait and validate file is complete and not corrupted
-            if not self._wait_for_file_ready(event.src_path):
-                logger.warning(f"File not ready or corrupted, skipping: {event.src_path}")
+            # Wait and validate file is complete and not corrupted. Only a
+            # ready file is marked seen, so a later event or probe retries it
+            if not self._wait_for_file_ready(pdf_path):
+                logger.warning(f"File not ready or corrupted, skipping: {pdf_path}")
+                with self._lock:
+                    self.not_ready[pdf_path] = _file_signature(pdf_path)
                 return
             
+            with self._lock:
+                self.seen.add(pdf_path)
+                self.not_ready.pop(pdf_path, None)
+            
             # Process PDF
-            result = self.extractor.process_pdf(event.src_path)
+            with self._process_lock:
+                result = self.extractor.process_pdf(pdf_path)
             
             # Log actual result
             if result.get('success', True) and not result.get('error'):
-                logger.info(f"Successfully processed: {event.src_path} - "
+                logger.info(f"Successfully processed: {pdf_path} - "
                            f"Headers: {result.get('headers_extracted', 0)}, "
                            f"Splits: {result.get('split_pdfs_created', 0)}")
             else:
-                logger.error(f"Failed to process: {event.src_path} - {result.get('error', 'Unknown error')}")
+                logger.error(f"Failed to process: {pdf_path} - {result.get('error', 'Unknown error')}")
         
         except Exception as e:
-            logger.error(f"Error processing {event.src_path}: {e}", exc_info=True)
+            logger.error(f"Error processing {pdf_path}: {e}", exc_info=True)
         
         finally:
-            self.processing.discard(event.src_path)
+            with self._lock:
+                self.processing.discard(pdf_path)
     
     def _wait_for_file_ready(self, filepath: str, max_attempts: int = 5) -> bool:
         """Wait for file to be fully written and validate it's not corrupted"""
@@ -137,6 +233,89 @@ class PDFHandler(FileSystemEventHandler):
         return False
 
 
+class ObserverHealthProbe(threading.Thread):
+    """
+    Detects silently dropped watcher events and recovers from them
+    
+    Native backends (inotify, ReadDirectoryChangesW) can lose events under
+    bursts or buffer overflow. Every `interval` seconds the input folder is
+    scanned and any PDF the handler never saw is processed directly. If files
+    are missed on `max_misses` consecutive probes (or the native observer
+    thread died), the observer is replaced by a PollingObserver.
+    """
+    
+    def __init__(
+        self,
+        handler: PDFHandler,
+        observer,
+        input_folder: Path,
+        poll_timeout: float,
+        interval: float = 60.0,
+        max_misses: int = 2
+    ):
+        super().__init__(daemon=True, name="PDFWatcher-HealthProbe")
+        self.handler = handler
+        self.observer = observer
+        self.input_folder = input_folder
+        self.poll_timeout = poll_timeout
+        self.interval = interval
+        self.max_misses = max_misses
+        self.consecutive_misses = 0
+        self.total_missed = 0
+        self.shutdown_event = threading.Event()
+    
+    @property
+    def using_polling(self) -> bool:
+        return isinstance(self.observer, PollingObserver)
+    
+    def run(self):
+        while not self.shutdown_event.wait(self.interval):
+            try:
+                self.probe()
+            except Exception as e:
+                logger.error(f"Watcher health probe error: {e}", exc_info=True)
+    
+    def probe(self):
+        """Run one health check: recover missed files, fall back to polling if needed"""
+        if not self.using_polling and not self.observer.is_alive():
+            logger.warning("Native file observer stopped unexpectedly")
+            self._switch_to_polling()
+        
+        missed, retries = self.handler.find_missed(self.input_folder)
+        if missed:
+            self.consecutive_misses += 1
+            self.total_missed += len(missed)
+            logger.warning(f"Watcher missed {len(missed)} PDF(s) "
+                           f"(consecutive probes: {self.consecutive_misses}, total: {self.total_missed})")
+            
+            if self.consecutive_misses >= self.max_misses and not self.using_polling:
+                self._switch_to_polling()
+        else:
+            self.consecutive_misses = 0
+        
+        for pdf_path in missed + retries:
+            if self.shutdown_event.is_set():
+                break
+            self.handler.process_missed(pdf_path)
+    
+    def _switch_to_polling(self):
+        """Replace the native observer with a PollingObserver on the same folder"""
+        logger.warning(f"Switching to PollingObserver (interval: {self.poll_timeout}s)")
+        try:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error stopping native observer: {e}")
+        
+        observer = PollingObserver(timeout=self.poll_timeout)
+        observer.schedule(self.handler, str(self.input_folder), recursive=False)
+        observer.start()
+        self.observer = observer
+    
+    def stop(self):
+        self.shutdown_event.set()
+
+
 def main():
     """Main service loop"""
     logger.info("="*60)
@@ -163,10 +342,20 @@ def main():
     
     # Setup observer
     event_handler = PDFHandler(extractor, metrics)
+    event_handler.mark_existing(input_folder)
     observer = Observer()
     observer.schedule(event_handler, str(input_folder), recursive=False)
     observer.start()
     
+    # Recover from silently dropped events (falls back to polling if needed)
+    health_probe = ObserverHealthProbe(
+        event_handler,
+        observer,
+        input_folder,
+        poll_timeout=config.watch_interval
+    )
+    health_probe.start()
+    
     logger.info("Service is running. Press Ctrl+C to stop.")
     logger.info("="*60)
     
@@ -181,8 +370,13 @@ def main():
     
     except KeyboardInterrupt:
         logger.info("Shutdown signal received...")
-        observer.stop()
     
+    health_probe.stop()
+    health_probe.join(timeout=_PROBE_JOIN_TIMEOUT)
+    if health_probe.is_alive():
+        logger.warning(f"Health probe still processing after {_PROBE_JOIN_TIMEOUT:.0f}s; not waiting for it")
+    observer = health_probe.observer
+    observer.stop()
     observer.join()
     
     # Final metrics
@@ -3,20 +3,58 @@ Config Manager - Type-safe configuration management
 Replaces raw ConfigParser with validated dataclasses
 """
 
-from dataclasses import dataclass, field
-from typing import List
-import configparser
+from dataclasses import MISSING, dataclass, field, fields
+from typing import (
+    Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Tuple, get_type_hints,
+)
+import functools
 import logging
+import os
+import re
+import sys
 
 logger = logging.getLogger(__name__)
 
+__all__ = ['ExtractionConfig', 'ConfigManager', 'FastConfigParser']
 
-@dataclass
+# Same spellings as configparser.ConfigParser.BOOLEAN_STATES, without importing configparser
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_DEBUG_IMAGE_FORMATS = frozenset({'png', 'jpg', 'lz4'})
+
+# (field_name, min, max) inclusive ranges checked in ExtractionConfig.__post_init__
+_RANGE_CHECKS = (
+    ('header_area_top', 0, 100),
+    ('header_area_width', 0, 100),
+)
+
+
+def _parse_char_pairs(raw: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse 'S:5,b:8' into (('S', '5'), ('B', '8')); tokens that are not char pairs are skipped"""
+    pairs = []
+    for token in (raw or '').split(','):
+        if ':' not in token:
+            continue
+        left, right = token.upper().split(':', 1)
+        left = left.strip()
+        right = right.strip()
+        if len(left) == 1 and len(right) == 1:
+            pairs.append((left, right))
+    return tuple(pairs)
+
+
+@dataclass(frozen=True, slots=True)
 class ExtractionConfig:
     """
     Type-safe configuration for PDF extraction
     
-    All settings validated at initialization to catch config errors early
+    All settings validated at initialization to catch config errors early.
+    Instances are frozen so one config can be shared by all workers; use
+    dataclasses.replace() to derive a modified copy.
     """
     
     # Header region settings
@@ -26,7 +64,7 @@ class ExtractionConfig:
     header_area_height: float = 15.0
     
     # Pages to process
-    pages_to_read: List[int] = field(default_factory=lambda: [1])
+    pages_to_read: Tuple[int, ...] = (1,)  # Empty means all pages
     
     # Pattern validation
     enable_pattern_validation: bool = True
@@ -44,7 +82,7 @@ class ExtractionConfig:
     pattern_code_max: int = 4
     pattern_serial_min: int = 7
     pattern_serial_max: int = 10
-    pattern_serial_allowed_prefixes: List[str] = field(default_factory=lambda: ['S', 'R'])
+    pattern_serial_allowed_prefixes: Tuple[str, ...] = ('S', 'R')
     serial_prefix_required: bool = True
     serial_digits_exact: int = 8
     invalid_serial_score_cap: int = 89
@@ -73,6 +111,7 @@ class ExtractionConfig:
     
     # OCR Enhancement (V3.1 - Full Upgrade)
     tesseract_cmd: str = ''
+    tesseract_lang: str = 'eng'
     tesseract_psm_mode: int = 7
     tesseract_char_whitelist: str = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-'
     enable_deskewing: bool = True
@@ -85,6 +124,7 @@ class ExtractionConfig:
     
     # Input/Output paths (NEW in V3)
     input_folder: str = 'input'
+    watch_interval: float = 1.0  # PollingObserver interval when native events are lost
     output_base_dir: str = 'output'
     organize_by_year_and_date: bool = True
     output_retention_days: int = 90
@@ -99,6 +139,7 @@ class ExtractionConfig:
     organize_by_date: bool = True
     save_method_images: bool = True
     image_retention_days: int = 30
+    debug_image_format: str = 'jpg'  # jpg, png or lz4
     
     # API logging
     api_log_url: str = 'http://mth-vm-pdw/pdw-picklist-api/api/PDW/AddExtractionLog'
@@ -175,14 +216,30 @@ class ExtractionConfig:
     code_anchor_rescue_scale: float = 7.5
     code_anchor_rescue_only_on_no_char_boxes: bool = True
     
+    # Derived values (computed in __post_init__, not read from INI)
+    compiled_header_pattern: Optional[Pattern[str]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    whitelist_set: FrozenSet[str] = field(
+        init=False, default=frozenset(), repr=False, compare=False
+    )
+    ambiguous_pairs_tuple: Tuple[Tuple[str, str], ...] = field(
+        init=False, default=(), repr=False, compare=False
+    )
+    code_ambiguity_pairs_tuple: Tuple[Tuple[str, str], ...] = field(
+        init=False, default=(), repr=False, compare=False
+    )
+    code_box_alignment_pairs_tuple: Tuple[Tuple[str, str], ...] = field(
+        init=False, default=(), repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Validate configuration after initialization"""
         # Validate header area
-        if not (0 <= self.header_area_top <= 100):
-            raise ValueError(f"header_area_top must be 0-100, got {self.header_area_top}")
-        
-        if not (0 <= self.header_area_width <= 100):
-            raise ValueError(f"header_area_width must be 0-100, got {self.header_area_width}")
+        for name, low, high in _RANGE_CHECKS:
+            value = getattr(self, name)
+            if not (low <= value <= high):
+                raise ValueError(f"{name} must be {low}-{high}, got {value}")
         
         # Validate render scales
         if self.initial_render_scale > self.max_render_scale:
@@ -193,11 +250,130 @@ class ExtractionConfig:
             raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
         
         # Validate log level
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.log_level.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}, got {self.log_level}")
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {sorted(_VALID_LOG_LEVELS)}, got {self.log_level}")
         
-        logger.info("Configuration validated successfully")
+        # Validate debug image format
+        if self.debug_image_format.lower() not in _VALID_DEBUG_IMAGE_FORMATS:
+            raise ValueError(
+                f"debug_image_format must be one of {sorted(_VALID_DEBUG_IMAGE_FORMATS)}, "
+                f"got {self.debug_image_format}"
+            )
+        
+        # Compile once so every consumer shares the same pattern object
+        object.__setattr__(
+            self,
+            'compiled_header_pattern',
+            re.compile(self.header_pattern) if self.header_pattern else None
+        )
+        
+        # Split the 'A:B,C:D' and whitelist strings once instead of per OCR call
+        object.__setattr__(self, 'whitelist_set', frozenset(self.character_whitelist))
+        object.__setattr__(self, 'ambiguous_pairs_tuple', _parse_char_pairs(self.ambiguous_characters))
+        object.__setattr__(self, 'code_ambiguity_pairs_tuple', _parse_char_pairs(self.code_ambiguity_pairs))
+        object.__setattr__(
+            self,
+            'code_box_alignment_pairs_tuple',
+            _parse_char_pairs(self.code_box_alignment_ambiguity_pairs)
+        )
+        
+        logger.debug("Configuration validated successfully")
+
+
+class FastConfigSection:
+    """
+    Read-only section view with the configparser SectionProxy getters
+    
+    Keys are matched case-insensitively; a missing key returns the fallback.
+    """
+    
+    __slots__ = ('_values',)
+    
+    def __init__(self, values: Dict[str, str]):
+        self._values = values
+    
+    def __contains__(self, key: str) -> bool:
+        return key.lower() in self._values
+    
+    def get(self, key: str, fallback: Optional[str] = None) -> Optional[str]:
+        return self._values.get(key.lower(), fallback)
+    
+    def getint(self, key: str, fallback: Optional[int] = None) -> Optional[int]:
+        value = self._values.get(key.lower())
+        return fallback if value is None else int(value)
+    
+    def getfloat(self, key: str, fallback: Optional[float] = None) -> Optional[float]:
+        value = self._values.get(key.lower())
+        return fallback if value is None else float(value)
+    
+    def getboolean(self, key: str, fallback: Optional[bool] = None) -> Optional[bool]:
+        value = self._values.get(key.lower())
+        if value is None:
+            return fallback
+        try:
+            return _BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}")
+
+
+class FastConfigParser:
+    """
+    Regex-based INI reader for the flat `key = value` files used by V3
+    
+    Parses the whole text in one pass into plain dicts instead of going
+    through configparser's line-by-line state machine. Supports `[Section]`
+    headers, `=` delimiters and full-line `#`/`;` comments; values are
+    stripped and never interpolated.
+    """
+    
+    SECTION_RE = re.compile(r'^[ \t]*\[([^\]\n]+)\][ \t]*\r?$', re.M)
+    KV_RE = re.compile(r'^[ \t]*([^=;#\s\[][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*\r?$', re.M)
+    
+    def __init__(self):
+        self._sections: Dict[str, FastConfigSection] = {}
+    
+    def read(self, config_path: str, encoding: str = 'utf-8') -> List[str]:
+        """Read a file; like configparser, a missing file is silently skipped"""
+        try:
+            # One read() of the raw bytes; no text-layer line iteration
+            with open(config_path, 'rb') as f:
+                data = f.read().decode(encoding)
+        except OSError:
+            return []
+        self.read_string(data.lstrip('\ufeff'))  # Tolerate a UTF-8 BOM (Notepad)
+        return [config_path]
+    
+    def read_string(self, data: str):
+        headers = list(self.SECTION_RE.finditer(data))
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(data)
+            values = {
+                key.lower(): value
+                for key, value in self.KV_RE.findall(data, header.end(), end)
+            }
+            name = header.group(1).strip()
+            if name in self._sections:
+                self._sections[name]._values.update(values)
+            else:
+                self._sections[name] = FastConfigSection(values)
+    
+    def sections(self) -> List[str]:
+        return list(self._sections)
+    
+    def has_section(self, section: str) -> bool:
+        return section in self._sections
+    
+    def add_section(self, section: str):
+        """Add an empty section; like configparser, an existing one is an error"""
+        if section in self._sections:
+            raise ValueError(f"Section {section!r} already exists")
+        self._sections[section] = FastConfigSection({})
+    
+    def __contains__(self, section: str) -> bool:
+        return section in self._sections
+    
+    def __getitem__(self, section: str) -> FastConfigSection:
+        return self._sections[section]
 
 
 class ConfigManager:
@@ -210,185 +386,140 @@ class ConfigManager:
         """
         Load configuration from INI file
         
+        Repeated loads of an unchanged file (same path, mtime and size)
+        return the cached instance; ExtractionConfig is frozen, so sharing
+        it is safe. A new process always parses (and validates) the file.
+        
         Args:
             config_path: Path to config.ini file
         
         Returns:
             ExtractionConfig: Validated configuration object
         """
-        parser = configparser.ConfigParser()
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            return ConfigManager._parse_file(config_path)  # Missing file: all defaults
+        return ConfigManager._load_cached(config_path, st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_cached(config_path: str, mtime_ns: int, size: int) -> ExtractionConfig:
+        """Parse config_path once per (path, mtime_ns, size) key"""
+        return ConfigManager._parse_file(config_path)
+    
+    @staticmethod
+    def _parse_file(config_path: str) -> ExtractionConfig:
+        """Read and parse an INI file into a validated ExtractionConfig"""
+        parser = FastConfigParser()
         parser.read(config_path, encoding='utf-8')
         
-        settings = parser['Settings'] if 'Settings' in parser else {}
-        
-        # Parse pages to read
-        pages_str = settings.get('pages_to_read', '1').strip().lower()
-        if pages_str == 'all':
-            pages_to_read = []  # Empty list means 'all pages'
-        else:
-            pages_to_read = [int(p.strip()) for p in pages_str.split(',') if p.strip().isdigit()]
+        # A missing file or [Settings] section means all defaults; add an
+        # empty section so the typed getters are always available
+        if not parser.has_section('Settings'):
+            parser.add_section('Settings')
+        settings = parser['Settings']
         
-        # Parse serial prefixes
-        prefixes_str = settings.get('pattern_serial_allowed_prefixes', 'S,R')
-        allowed_prefixes = [p.strip().upper() for p in prefixes_str.split(',') if p.strip()]
-        
-        config = ExtractionConfig(
-            # Header region
-            header_area_top=settings.getfloat('header_area_top', 0.0),
-            header_area_left=settings.getfloat('header_area_left', 0.0),
-            header_area_width=settings.getfloat('header_area_width', 100.0),
-            header_area_height=settings.getfloat('header_area_height', 15.0),
-            
-            # Pages
-            pages_to_read=pages_to_read,
-            
-            # Pattern validation
-            enable_pattern_validation=settings.getboolean('enable_pattern_validation', True),
-            expected_parts=settings.getint('expected_parts', 4),
-            min_expected_parts=settings.getint('min_expected_parts', 3),
-            expected_separator=settings.get('expected_separator', '-'),
-            expected_digit_count=settings.getint('expected_digit_count', 8),
-            min_digit_count=settings.getint('min_digit_count', 6),
-            
-            # Pattern structure
-            pattern_prefix_length=settings.getint('pattern_prefix_length', 1),
-            pattern_country_min=settings.getint('pattern_country_min', 1),
-            pattern_country_max=settings.getint('pattern_country_max', 2),
-            pattern_code_min=settings.getint('pattern_code_min', 2),
-            pattern_code_max=settings.getint('pattern_code_max', 4),
-            pattern_serial_min=settings.getint('pattern_serial_min', 7),
-            pattern_serial_max=settings.getint('pattern_serial_max', 10),
-            pattern_serial_allowed_prefixes=allowed_prefixes,
-            serial_prefix_required=settings.getboolean('serial_prefix_required', True),
-            serial_digits_exact=settings.getint('serial_digits_exact', 8),
-            invalid_serial_score_cap=settings.getint('invalid_serial_score_cap', 89),
-            serial_close_match_threshold=settings.getfloat('serial_close_match_threshold', 0.85),
-            
-            # Performance
-            enable_parallel_processing=settings.getboolean('enable_parallel_processing', True),
-            max_workers=settings.getint('max_workers', 4),
-            
-            # Adaptive rendering
-            adaptive_rendering=settings.getboolean('adaptive_rendering', True),
-            initial_render_scale=settings.getfloat('initial_render_scale', 2.0),
-            max_render_scale=settings.getfloat('max_render_scale', 6.0),
-            score_threshold_for_escalation=settings.getint('score_threshold_for_escalation', 70),
-            
-            # OCR budget
-            max_ocr_attempts=settings.getint('max_ocr_attempts', 8),
-            early_exit_score=settings.getint('early_exit_score', 90),
-            voting_method_score_threshold=settings.getint('voting_method_score_threshold', 70),
-            ocr_method_early_exit_min_attempts=settings.getint('ocr_method_early_exit_min_attempts', 2),
-            ocr_method_early_exit_min_confirmations=settings.getint('ocr_method_early_exit_min_confirmations', 2),
-            
-            # OCR optimization
-            ocr_filter_black_text=settings.getboolean('ocr_filter_black_text', True),
-            ocr_black_threshold=settings.getint('ocr_black_threshold', 100),
-            
-            # OCR Enhancement (V3.1)
-            tesseract_cmd=settings.get('tesseract_cmd', ''),
-            tesseract_psm_mode=settings.getint('tesseract_psm_mode', 7),
-            tesseract_char_whitelist=settings.get('tesseract_char_whitelist', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-'),
-            enable_deskewing=settings.getboolean('enable_deskewing', True),
-            enable_morphological_ops=settings.getboolean('enable_morphological_ops', True),
-            enable_clahe=settings.getboolean('enable_clahe', True),
-            enable_multi_engine=settings.getboolean('enable_multi_engine', False),
-            use_easyocr=settings.getboolean('use_easyocr', False),
-            use_paddleocr=settings.getboolean('use_paddleocr', False),
-            enable_pattern_correction=settings.getboolean('enable_pattern_correction', True),
-            
-            # Input/Output paths
-            input_folder=settings.get('input_folder', 'input'),
-            output_base_dir=settings.get('output_base_dir', 'output'),
-            organize_by_year_and_date=settings.getboolean('organize_by_year_and_date', True),
-            output_retention_days=settings.getint('output_retention_days', 90),
-            
-            # Reports paths (V3.1)
-            reports_base_dir=settings.get('reports_base_dir', 'reports'),
-            reports_organize_by_date=settings.getboolean('reports_organize_by_date', True),
-            
-            # Debug images
-            save_debug_images=settings.getboolean('save_debug_images', True),
-            debug_images_folder=settings.get('debug_images_folder', 'debug_images'),
-            organize_by_date=settings.getboolean('organize_by_date', True),
-            save_method_images=settings.getboolean('save_method_images', True),
-            image_retention_days=settings.getint('image_retention_days', 30),
-            
-            # API logging
-            api_log_url=settings.get('api_log_url', 'http://mth-vm-pdw/pdw-picklist-api/api/PDW/AddExtractionLog'),
-            enable_api_logging=settings.getboolean('enable_api_logging', True),
-            api_log_async=settings.getboolean('api_log_async', True),
-            api_queue_size=settings.getint('api_queue_size', 1000),
-            api_timeout=settings.getint('api_timeout', 5),
-            circuit_breaker_threshold=settings.getint('circuit_breaker_threshold', 5),
-            
-            # Filename sanitization
-            remove_special_chars=settings.getboolean('remove_special_chars', True),
-            replace_spaces_with=settings.get('replace_spaces_with', '_'),
-            max_filename_length=settings.getint('max_filename_length', 100),
-            
-            # PDF splitting
-            enable_pdf_splitting=settings.getboolean('enable_pdf_splitting', True),
-            min_pages_per_split=settings.getint('min_pages_per_split', 1),
-            header_similarity_threshold=settings.getfloat('header_similarity_threshold', 1.0),
-            enable_serial_based_matching=settings.getboolean('enable_serial_based_matching', True),
-            split_naming_pattern=settings.get('split_naming_pattern', '{header}_pages_{start}-{end}'),
-            
-            # Logging
-            log_level=settings.get('log_level', 'INFO'),
-            log_method_details=settings.getboolean('log_method_details', False),
-            
-            # Metrics
-            enable_metrics_tracking=settings.getboolean('enable_metrics_tracking', True),
-            metrics_export_path=settings.get('metrics_export_path', 'metrics.json'),
-
-            # PaddleOCR Fallback (V3.2)
-            enable_paddleocr_fallback=settings.getboolean('enable_paddleocr_fallback', True),
-            tesseract_confidence_threshold=settings.getfloat('tesseract_confidence_threshold', 85.0),
-            enable_pattern_check=settings.getboolean('enable_pattern_check', True),
-            header_pattern=settings.get('header_pattern', r'^[A-Z](?:-[A-Z0-9]{1,8}){1,2}-[SR][0-9]{7,8}$'),
-            ambiguous_characters=settings.get('ambiguous_characters', 'S:5,B:8,P:F,O:0,I:1,Z:2'),
-            character_whitelist=settings.get('character_whitelist', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-'),
-            enable_ensemble_voting=settings.getboolean('enable_ensemble_voting', True),
-
-            # Code ambiguity monitoring (observe-only)
-            enable_code_ambiguity_monitor=settings.getboolean('enable_code_ambiguity_monitor', True),
-            code_ambiguity_pairs=settings.get('code_ambiguity_pairs', 'O:0,I:L'),
-            code_ambiguity_only_mixed_alnum=settings.getboolean('code_ambiguity_only_mixed_alnum', True),
-            code_ambiguity_allow_same_type_pairs=settings.getboolean('code_ambiguity_allow_same_type_pairs', True),
-            enable_code_ambiguity_autocorrect=settings.getboolean('enable_code_ambiguity_autocorrect', False),
-            code_autocorrect_min_support=settings.getint('code_autocorrect_min_support', 1),
-            code_autocorrect_require_scale_evidence=settings.getboolean('code_autocorrect_require_scale_evidence', True),
-            code_autocorrect_force_multi_scale=settings.getboolean('code_autocorrect_force_multi_scale', True),
-            enable_code_anchor_harmonize=settings.getboolean('enable_code_anchor_harmonize', True),
-            code_anchor_harmonize_min_glyph_support=settings.getint('code_anchor_harmonize_min_glyph_support', 1),
-            enable_code_glyph_disambiguation=settings.getboolean('enable_code_glyph_disambiguation', True),
-            code_zero_to_o_width_ratio=settings.getfloat('code_zero_to_o_width_ratio', 1.12),
-            enable_code_char_classifier=settings.getboolean('enable_code_char_classifier', True),
-            code_char_classifier_min_confidence=settings.getfloat('code_char_classifier_min_confidence', 0.72),
-            code_char_classifier_min_margin=settings.getfloat('code_char_classifier_min_margin', 0.12),
-            code_char_classifier_allow_leading_zero_to_o=settings.getboolean('code_char_classifier_allow_leading_zero_to_o', False),
-            code_char_classifier_enable_width_vote=settings.getboolean('code_char_classifier_enable_width_vote', True),
-            code_char_classifier_min_vote_support=settings.getint('code_char_classifier_min_vote_support', 2),
-            code_char_classifier_max_positions=settings.getint('code_char_classifier_max_positions', 4),
-            code_char_classifier_require_evidence=settings.getboolean('code_char_classifier_require_evidence', False),
-            code_char_classifier_min_evidence_support=settings.getint('code_char_classifier_min_evidence_support', 2),
-            code_char_tesseract_confidence_threshold=settings.getfloat('code_char_tesseract_confidence_threshold', 72.0),
-            code_char_box_padding_ratio=settings.getfloat('code_char_box_padding_ratio', 0.18),
-            enable_code_glyph_width_fallback=settings.getboolean('enable_code_glyph_width_fallback', False),
-            enable_code_ambiguity_confirm_high_scale=settings.getboolean('enable_code_ambiguity_confirm_high_scale', True),
-            code_ambiguity_confirm_scale=settings.getfloat('code_ambiguity_confirm_scale', 6.0),
-            enable_code_ambiguity_full_ocr_confirm=settings.getboolean('enable_code_ambiguity_full_ocr_confirm', True),
-            code_ambiguity_full_ocr_confirm_min_support=settings.getint('code_ambiguity_full_ocr_confirm_min_support', 2),
-            enable_code_image_support_rescue=settings.getboolean('enable_code_image_support_rescue', True),
-            code_image_support_min_votes=settings.getint('code_image_support_min_votes', 1),
-            code_image_support_max_attempts=settings.getint('code_image_support_max_attempts', 6),
-            code_box_alignment_ambiguity_pairs=settings.get('code_box_alignment_ambiguity_pairs', 'O:0,S:5,F:E,I:L'),
-            code_box_alignment_min_match_ratio=settings.getfloat('code_box_alignment_min_match_ratio', 0.35),
-            enable_code_anchor_rescue_pass=settings.getboolean('enable_code_anchor_rescue_pass', True),
-            code_anchor_rescue_scale=settings.getfloat('code_anchor_rescue_scale', 7.5),
-            code_anchor_rescue_only_on_no_char_boxes=settings.getboolean('code_anchor_rescue_only_on_no_char_boxes', True),
-        )
+        config = _load_settings(settings)
         
-        logger.info(f"Configuration loaded from: {config_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Configuration loaded from: {config_path}")
         return config
+
+
+_INT_RE = re.compile(r'\d+')
+
+
+def _parse_int_tuple(value: str) -> Tuple[int, ...]:
+    """Parse '1,2,5' into (1, 2, 5); 'all' gives () (meaning every page)"""
+    value = value.strip()
+    if value.lower() == 'all':
+        return ()
+    # One regex pass picks out every run of digits; separators are ignored
+    return tuple(map(int, _INT_RE.findall(value)))
+
+
+def _parse_str_tuple(value: str) -> Tuple[str, ...]:
+    """Parse 's, r' into ('S', 'R')"""
+    return tuple(sys.intern(p.strip().upper()) for p in value.split(',') if p.strip())
+
+
+# Section getter used to parse each scalar field type from the INI file
+_GETTERS = {float: 'getfloat', int: 'getint', bool: 'getboolean', str: 'get'}
+
+# Parsers for comma-separated fields (stored as immutable tuples)
+_TUPLE_PARSERS = {Tuple[int, ...]: _parse_int_tuple, Tuple[str, ...]: _parse_str_tuple}
+
+
+class FieldSpec(NamedTuple):
+    """How one ExtractionConfig field is read from the [Settings] section"""
+    name: str
+    getter: str  # FastConfigSection method: get/getint/getfloat/getboolean
+    default: Any
+    parser: Optional[Callable[[str], Any]] = None  # Applied to the raw `get` value
+
+
+def _build_field_specs() -> Tuple[FieldSpec, ...]:
+    """
+    Derive a FieldSpec for every INI-backed ExtractionConfig field
+    
+    The INI key is the field name and the dataclass default is the fallback,
+    so defaults live in exactly one place.
+    """
+    hints = get_type_hints(ExtractionConfig)
+    specs = []
+    for f in fields(ExtractionConfig):
+        if not f.init:
+            continue
+        default = f.default if f.default is not MISSING else f.default_factory()
+        field_type = hints[f.name]
+        if field_type in _GETTERS:
+            specs.append(FieldSpec(f.name, _GETTERS[field_type], default))
+        else:
+            specs.append(FieldSpec(f.name, 'get', default, _TUPLE_PARSERS[field_type]))
+    return tuple(specs)
+
+
+_FIELD_SPECS = _build_field_specs()
+
+
+def _build_loader():
+    """
+    Compile a straight-line `settings -> ExtractionConfig` function from _FIELD_SPECS
+    
+    Like the __init__ that dataclasses generates, the per-field getter calls
+    are unrolled into one function with the getters bound to locals, so a
+    load does no table iteration or getattr() dispatch. String values are
+    interned, so configs loaded from different files share them.
+    """
+    namespace = {'ExtractionConfig': ExtractionConfig, '_intern': sys.intern}
+    lines = [
+        'def _load_settings(settings):',
+        '    _get = settings.get',
+        '    _getint = settings.getint',
+        '    _getfloat = settings.getfloat',
+        '    _getboolean = settings.getboolean',
+        '    return ExtractionConfig(',
+    ]
+    for index, spec in enumerate(_FIELD_SPECS):
+        default_name = f'_default_{index}'
+        namespace[default_name] = spec.default
+        if spec.parser is None and spec.getter == 'get':
+            # Intern strings so every config shares one copy of e.g. the whitelist
+            namespace[default_name] = sys.intern(spec.default)
+            lines.append(f'        {spec.name}=_intern(_get({spec.name!r}, {default_name})),')
+        elif spec.parser is None:
+            lines.append(f'        {spec.name}=_{spec.getter}({spec.name!r}, {default_name}),')
+        else:
+            parser_name = f'_parse_{index}'
+            namespace[parser_name] = spec.parser
+            lines.append(
+                f'        {spec.name}={parser_name}(_raw) '
+                f'if (_raw := _{spec.getter}({spec.name!r})) is not None else {default_name},'
+            )
+    lines.append('    )')
+    exec(compile('\n'.join(lines), '<ExtractionConfig loader>', 'exec'), namespace)
+    return namespace['_load_settings']
+
+
+_load_settings = _build_loader()
@@ -5,15 +5,22 @@ V3.1 - Generate comprehensive CSV reports for audit and verification
 
 import csv
 import logging
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Sequence
+from dataclasses import dataclass, fields
 
 logger = logging.getLogger(__name__)
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
@@ -21,10 +28,71 @@ except ImportError:
     EXCEL_AVAILABLE = False
     logger.warning("openpyxl not available - Excel reports disabled")
 
+try:
+    from datasketch import HyperLogLog
+    HLL_AVAILABLE = True
+except ImportError:
+    HLL_AVAILABLE = False
+
+# HyperLogLog precision: 2**12 registers (~4 KB), ~1.6% standard error
+_HLL_PRECISION = 12
+
+if EXCEL_AVAILABLE:
+    # Shared style objects: built once so openpyxl's style table de-dups them
+    _HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    _HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+    _ERROR_FILL = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+    _ERROR_FONT = Font(color="FFFFFF", bold=True)
+    _WARNING_FILL = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+    _WARNING_FONT = Font(color="000000", bold=True)
+    _SUMMARY_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    _SUMMARY_FONT = Font(bold=True, size=12)
+    _SUMMARY_TITLE_FONT = Font(bold=True, size=14, color="1F4E78")
+    _CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+    
+    # Row highlighting (fill, font) indexed by Status; None = unstyled
+    _STYLE_BY_STATUS = (
+        None,
+        (_WARNING_FILL, _WARNING_FONT),
+        (_ERROR_FILL, _ERROR_FONT),
+    )
+
+
+def _styled_cell(ws, value, font=None, fill=None, alignment=None) -> 'WriteOnlyCell':
+    """Create a write-only cell that shares the given module-level style objects"""
+    cell = WriteOnlyCell(ws, value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+class Status(IntEnum):
+    """Record status as a small int for report-writing dispatch"""
+    SUCCESS = 0
+    LOW_CONFIDENCE = 1
+    ERROR = 2
+
+
+# Status string -> Status; unknown statuses are treated like success (unstyled)
+_STATUS_BY_NAME = {
+    'success': Status.SUCCESS,
+    'low_confidence': Status.LOW_CONFIDENCE,
+    'error': Status.ERROR,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionRecord:
-    """Single extraction record for CSV export"""
+    """
+    Single extraction record for CSV export (slotted: no per-record __dict__)
+    
+    status stays the report's string; status_code maps it to a Status on
+    every read, so it follows later changes to status.
+    """
     timestamp: str
     pdf_filename: str
     page_number: int
@@ -39,9 +107,320 @@ class ExtractionRecord:
     split_group: str = ""  # Which split PDF it belongs to
     output_filename: str = ""
     
+    @property
+    def status_code(self) -> Status:
+        """Status for the status string (unknown statuses count as success)"""
+        return _STATUS_BY_NAME.get(self.status, Status.SUCCESS)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for CSV writing"""
-        return asdict(self)
+        return dict(zip(_FIELDS, _record_row(self)))
+
+
+def _set_column_widths(ws, *row_groups) -> None:
+    """
+    Size each column to its longest value (+2, capped at 50)
+    
+    A write-only sheet emits its column widths before the first row, so
+    the widths are measured from the row tuples in one pass up front
+    instead of re-reading every cell after writing.
+    """
+    max_lengths = {}
+    for rows in row_groups:
+        for row in rows:
+            for col_idx, value in enumerate(row, start=1):
+                if value is None:
+                    continue
+                # Most values are already str; skip the str() copy for them
+                length = len(value) if type(value) is str else len(str(value))
+                if length > max_lengths.get(col_idx, 0):
+                    max_lengths[col_idx] = length
+    for col_idx, max_length in max_lengths.items():
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+
+
+# (epoch second, formatted) of the last record timestamp; swapped as one
+# tuple so concurrent add_extraction() calls never see a mismatched pair
+_timestamp_cache = (0, '')
+
+
+def _record_timestamp() -> str:
+    """Local 'YYYY-mm-dd HH:MM:SS', formatted at most once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if second != cached_second:
+        formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _timestamp_cache = (second, formatted)
+    return formatted
+
+
+# File buffer for CSV writes: whole reports go out in a few large write() calls
+_WRITE_BUFFER = 1 << 20
+
+# Column order for every report (ExtractionRecord field order)
+_FIELDS = tuple(f.name for f in fields(ExtractionRecord))
+# record -> row tuple in _FIELDS order (no astuple deep-copy per value)
+_record_row = attrgetter(*_FIELDS)
+_HEADERS = tuple(fieldname.replace('_', ' ').title() for fieldname in _FIELDS)
+
+
+def _summary_rows(summary_stats: Optional[Dict]) -> List[tuple]:
+    """(label, value) display rows for a summary statistics dict"""
+    return [
+        (key.replace('_', ' ').title(), str(value))
+        for key, value in (summary_stats or {}).items()
+    ]
+
+
+def _append_summary_block(ws, summary_rows: List[tuple], title_row: int) -> None:
+    """Append the merged title row (at sheet row title_row) and one styled row per stat"""
+    ws.merged_cells.add(f'A{title_row}:D{title_row}')
+    ws.append([
+        _styled_cell(ws, "SUMMARY STATISTICS", _SUMMARY_TITLE_FONT, alignment=_CENTER_ALIGN)
+    ])
+    for label, value in summary_rows:
+        ws.append([
+            _styled_cell(ws, label, _SUMMARY_FONT, _SUMMARY_FILL),
+            _styled_cell(ws, value, fill=_SUMMARY_FILL),
+        ])
+
+
+def _append_header_row(ws, header_fill) -> None:
+    ws.append([_styled_cell(ws, header, _HEADER_FONT, header_fill, _CENTER_ALIGN) for header in _HEADERS])
+
+
+def _append_record_row(ws, record: ExtractionRecord, row: tuple) -> None:
+    """Append one record; only error/low-confidence rows need styled cells"""
+    style = _STYLE_BY_STATUS[record.status_code]
+    if style is None:
+        ws.append(row)
+    else:
+        fill, font = style
+        ws.append([_styled_cell(ws, value, font, fill) for value in row])
+
+
+def _write_excel_stream(
+    path: Path,
+    records: Sequence[ExtractionRecord],
+    title: str,
+    header_fill,
+    summary_stats: Optional[Dict] = None
+) -> None:
+    """
+    Stream records into a single-sheet write-only workbook
+    
+    Shared by the extraction and error reports. Writes an optional summary
+    block, the styled header row and one row per record (error and
+    low-confidence rows highlighted), then saves to path.
+    
+    Args:
+        path: Output .xlsx path
+        records: Records to write, in order
+        title: Worksheet title
+        header_fill: Fill for the header row
+        summary_stats: Optional statistics written above the header
+    """
+    # Write-only workbook streams rows to disk instead of keeping
+    # a Cell object per value in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    
+    rows = [_record_row(record) for record in records]
+    summary_rows = _summary_rows(summary_stats)
+    summary_block = [("SUMMARY STATISTICS",), *summary_rows] if summary_stats else []
+    _set_column_widths(ws, summary_block, [_HEADERS], rows)
+    
+    # Write summary statistics first
+    if summary_stats:
+        _append_summary_block(ws, summary_rows, title_row=1)
+        ws.append([])  # Empty row separator
+    
+    _append_header_row(ws, header_fill)
+    for record, row in zip(records, rows):
+        _append_record_row(ws, record, row)
+    
+    wb.save(path)
+
+
+# Report columns generate_summary_report reads, in _SummaryAccumulator.add() order
+_SUMMARY_COLUMNS = ('status', 'confidence_score', 'processing_time_ms', 'header_extracted', 'split_group')
+
+
+class _SummaryAccumulator:
+    """
+    Running totals behind generate_summary_report
+    
+    Fed one row at a time (from a CSV file or rows already being streamed
+    elsewhere), so statistics never need a separate pass over the data.
+    Values are the report's CSV strings.
+    
+    Unique header/split group counts use fixed-size HyperLogLog sketches
+    (approximate) when datasketch is installed, exact sets otherwise or
+    when exact_unique is set.
+    """
+    
+    __slots__ = ('status_counts', 'score_sum', 'score_count', 'time_sum', 'time_count',
+                 'headers', 'split_groups', '_add_header', '_add_split_group')
+    
+    def __init__(self, exact_unique: bool = False):
+        self.status_counts = Counter()
+        self.score_sum = self.score_count = 0
+        self.time_sum = 0.0
+        self.time_count = 0
+        if exact_unique or not HLL_AVAILABLE:
+            self.headers = set()
+            self.split_groups = set()
+            self._add_header = self.headers.add
+            self._add_split_group = self.split_groups.add
+        else:
+            self.headers = HyperLogLog(p=_HLL_PRECISION)
+            self.split_groups = HyperLogLog(p=_HLL_PRECISION)
+            self._add_header = lambda value, update=self.headers.update: update(value.encode())
+            self._add_split_group = lambda value, update=self.split_groups.update: update(value.encode())
+    
+    def add(self, status: str, score: str, processing_time: str, header: str, split_group: str) -> None:
+        self.status_counts[status] += 1
+        if score.isdigit():
+            self.score_sum += int(score)
+            self.score_count += 1
+        if processing_time:
+            self.time_sum += float(processing_time)
+            self.time_count += 1
+        if header:
+            self._add_header(header)
+        if split_group:
+            self._add_split_group(split_group)
+    
+    @staticmethod
+    def positions(fieldnames: Sequence[str]) -> List[int]:
+        """Indexes of _SUMMARY_COLUMNS in fieldnames (missing columns point past every row)"""
+        return [fieldnames.index(name) if name in fieldnames else len(fieldnames)
+                for name in _SUMMARY_COLUMNS]
+    
+    def add_row(self, row: Sequence[str], positions: Sequence[int]) -> None:
+        """Accumulate a positional CSV row (see positions())"""
+        self.add(*[row[i] if i < len(row) else '' for i in positions])
+    
+    def tee(self, rows, fieldnames: Sequence[str]):
+        """Yield rows unchanged while accumulating them (positional CSV rows)"""
+        positions = self.positions(fieldnames)
+        for row in rows:
+            self.add_row(row, positions)
+            yield row
+    
+    @staticmethod
+    def _cardinality(values) -> int:
+        # len() of a HyperLogLog is its register count, not the estimate
+        return len(values) if isinstance(values, set) else round(values.count())
+    
+    @property
+    def total(self) -> int:
+        return sum(self.status_counts.values())
+    
+    def summary(self) -> Dict:
+        total_pages = self.total
+        if not total_pages:
+            return {}
+        
+        success_count = self.status_counts['success']
+        avg_score = self.score_sum / self.score_count if self.score_count else 0
+        avg_time = self.time_sum / self.time_count if self.time_count else 0
+        
+        return {
+            'total_pages': total_pages,
+            'success_count': success_count,
+            'error_count': self.status_counts['error'],
+            'low_confidence_count': self.status_counts['low_confidence'],
+            'success_rate': f"{(success_count / total_pages * 100):.1f}%",
+            'avg_confidence_score': round(avg_score, 1),
+            'avg_processing_time_ms': round(avg_time, 2),
+            'unique_headers': self._cardinality(self.headers),
+            'unique_split_groups': self._cardinality(self.split_groups)
+        }
+
+
+def _rows_with_text(f):
+    """
+    Yield (row, raw text) for each CSV record of a file opened with newline=''
+    
+    The raw text is the record's exact source lines (line ending included,
+    multi-line quoted fields intact), so it can be copied to another CSV
+    without re-serializing the row.
+    """
+    lines = []
+    
+    def source():
+        for line in f:
+            lines.append(line)
+            yield line
+    
+    # csv.reader pulls one line at a time and never reads past the record
+    for row in csv.reader(source()):
+        text = ''.join(lines)
+        lines.clear()
+        if not text.endswith('\n'):
+            text += '\r\n'  # Last line of a file without a trailing newline
+        yield row, text
+
+
+class _ReportStream:
+    """
+    Report file that records are written to as they are added
+    
+    Used by CSVReporter.start_stream(). The header goes out when the stream
+    opens and each record is appended immediately, so memory stays flat for
+    any job size. Because rows are final once written, the summary block is
+    appended after the data instead of above it.
+    """
+    
+    # Data widths aren't known when the write-only sheet's columns are emitted
+    COLUMN_WIDTH = 20
+    
+    def __init__(self, path: Path, use_excel: bool):
+        self.path = path
+        self.record_count = 0
+        self._wb = self._ws = self._file = self._writer = None
+        
+        if use_excel:
+            self._wb = Workbook(write_only=True)
+            self._ws = self._wb.create_sheet("Extraction Report")
+            for col_idx in range(1, len(_HEADERS) + 1):
+                self._ws.column_dimensions[get_column_letter(col_idx)].width = self.COLUMN_WIDTH
+            _append_header_row(self._ws, _HEADER_FILL)
+        else:
+            self._file = open(path, 'w', newline='', encoding='utf-8-sig', buffering=_WRITE_BUFFER)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(_FIELDS)
+    
+    def append(self, record: ExtractionRecord) -> None:
+        if self._ws is not None:
+            _append_record_row(self._ws, record, _record_row(record))
+        else:
+            self._writer.writerow(_record_row(record))
+        self.record_count += 1
+    
+    def finish(self, summary_stats: Optional[Dict] = None) -> Path:
+        """Write the trailing summary block and close/save the file"""
+        summary_rows = _summary_rows(summary_stats)
+        if self._ws is not None:
+            if summary_rows:
+                self._ws.append([])  # Empty row separator
+                # Header row + data rows + separator precede the title
+                _append_summary_block(self._ws, summary_rows, title_row=self.record_count + 3)
+            self._wb.save(self.path)
+        else:
+            with self._file:
+                if summary_rows:
+                    self._file.write("\n# SUMMARY STATISTICS\n")
+                    for key, value in summary_stats.items():
+                        self._file.write(f"# {key},{value}\n")
+        return self.path
+    
+    def abort(self) -> None:
+        """Close without saving (Excel) after a failure"""
+        if self._file is not None:
+            self._file.close()
 
 
 class CSVReporter:
@@ -80,12 +459,24 @@ class CSVReporter:
         # Create output folder
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
-        # Track records for batch writing
-        self.pending_records: List[ExtractionRecord] = []
+        # Track records for batch writing (deque: O(1) appends, no list regrowth copies)
+        self.pending_records: Deque[ExtractionRecord] = deque()
         
         # Track first extraction time for filename
         self.first_extraction_time: Optional[datetime] = None
         
+        # Guards pending_records/first_extraction_time: a failed async flush
+        # puts its records back from the writer thread
+        self._pending_lock = threading.Lock()
+        
+        # Streaming mode (start_stream): rows go straight to disk and only
+        # the error/low-confidence records are kept for the error report
+        self._stream: Optional[_ReportStream] = None
+        self.streamed_error_records: List[ExtractionRecord] = []
+        
+        # Background report writer for flush_to_csv_async (started on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         logger.info(f"Reporter initialized: {self.output_folder} (Excel: {self.use_excel})")
     
     def add_extraction(
@@ -119,12 +510,8 @@ class CSVReporter:
             split_group: Which split group (for PDF splitting)
             output_filename: Output filename if split
         """
-        # Track first extraction time for filename
-        if self.first_extraction_time is None:
-            self.first_extraction_time = datetime.now()
-        
         record = ExtractionRecord(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=_record_timestamp(),
             pdf_filename=pdf_filename,
             page_number=page_number,
             header_extracted=header_extracted,
@@ -139,7 +526,58 @@ class CSVReporter:
             output_filename=output_filename
         )
         
-        self.pending_records.append(record)
+        if self._stream is None:
+            with self._pending_lock:
+                # Track first extraction time for filename
+                if self.first_extraction_time is None:
+                    self.first_extraction_time = datetime.now()
+                self.pending_records.append(record)
+            return
+        
+        try:
+            self._stream.append(record)
+        except Exception as e:
+            logger.error(f"Failed to stream report row: {e}", exc_info=True)
+        if record.status_code:  # error / low_confidence
+            self.streamed_error_records.append(record)
+    
+    def start_stream(self) -> Optional[Path]:
+        """
+        Open the report file now and write each record as it is added
+        
+        Use this when records are final once added (nothing edits them
+        afterwards). Until flush_to_csv() closes the stream, records are
+        not kept in pending_records; error and low-confidence records are
+        collected in streamed_error_records for create_error_report().
+        
+        Returns:
+            Path of the report being written, or None if it couldn't be opened
+        """
+        if self._stream is not None:
+            return self._stream.path
+        
+        self.first_extraction_time = datetime.now()
+        extension = 'xlsx' if self.use_excel else 'csv'
+        path = self._report_folder() / (
+            f"extraction_report_{self.first_extraction_time.strftime('%Y%m%d_%H%M%S')}.{extension}"
+        )
+        try:
+            self._stream = _ReportStream(path, self.use_excel)
+        except Exception as e:
+            logger.error(f"Failed to start streaming report: {e}", exc_info=True)
+            return None
+        
+        self.streamed_error_records = []
+        logger.info(f"Streaming report to: {path}")
+        return path
+    
+    def _report_folder(self) -> Path:
+        """Folder for today's reports (created on demand)"""
+        if self.organize_by_date:
+            date_folder = self.output_folder / datetime.now().strftime("%Y-%m-%d")
+            date_folder.mkdir(parents=True, exist_ok=True)
+            return date_folder
+        return self.output_folder
     
     def flush_to_csv(
         self,
@@ -156,34 +594,117 @@ class CSVReporter:
         Returns:
             Path to created file
         """
+        if self._stream is not None:
+            return self._finish_stream(self._detach_stream(), summary_stats)
+        
         if not self.pending_records:
             logger.warning("No records to write")
             return None
         
-        # Determine output path
-        if self.organize_by_date:
-            date_folder = self.output_folder / datetime.now().strftime("%Y-%m-%d")
-            date_folder.mkdir(parents=True, exist_ok=True)
-            output_path = date_folder
-        else:
-            output_path = self.output_folder
+        return self._write_pending(*self._take_pending(), summary_stats)
+    
+    def flush_to_csv_async(
+        self,
+        job_id: Optional[str] = None,
+        summary_stats: Optional[Dict] = None
+    ) -> Future:
+        """
+        Write pending records like flush_to_csv() on a background thread
+        
+        The pending records are handed off before this returns, so new
+        add_extraction() calls start the next report and never race the
+        write. Reports are written one at a time, in submission order.
+        
+        Args:
+            job_id: Optional job ID for filename
+            summary_stats: Optional summary statistics to write at top
+        
+        Returns:
+            Future resolving to flush_to_csv()'s result; on a failed write
+            it resolves to None and the records are pending again
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CSVReporter-Writer")
+        
+        if self._stream is not None:
+            return self._executor.submit(self._finish_stream, self._detach_stream(), summary_stats)
+        
+        if not self.pending_records:
+            logger.warning("No records to write")
+            future = Future()
+            future.set_result(None)
+            return future
         
+        return self._executor.submit(self._write_pending, *self._take_pending(), summary_stats)
+    
+    def close(self) -> None:
+        """Wait for reports queued by flush_to_csv_async() and stop the writer thread"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def _take_pending(self) -> tuple:
+        """Detach pending records and their first extraction time; reset for the next report"""
+        with self._pending_lock:
+            records, self.pending_records = self.pending_records, deque()
+            first_extraction_time, self.first_extraction_time = self.first_extraction_time, None
+        return records, first_extraction_time
+    
+    def _write_pending(
+        self,
+        records: Deque[ExtractionRecord],
+        first_extraction_time: Optional[datetime],
+        summary_stats: Optional[Dict] = None
+    ) -> Optional[Path]:
+        """Write records taken by _take_pending(); put them back if the write fails"""
         # Generate filename using first extraction time
-        if self.first_extraction_time:
-            timestamp = self.first_extraction_time.strftime("%Y%m%d_%H%M%S")
-        else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (first_extraction_time or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        path = self._write_report(records, timestamp, summary_stats)
+        if path is None:
+            # Keep the records pending (ahead of any added meanwhile) for a retry
+            with self._pending_lock:
+                records.extend(self.pending_records)
+                self.pending_records = records
+                if first_extraction_time is not None:
+                    self.first_extraction_time = first_extraction_time
+        return path
+    
+    def _write_report(
+        self,
+        records: Sequence[ExtractionRecord],
+        timestamp: str,
+        summary_stats: Optional[Dict] = None
+    ) -> Optional[Path]:
+        """Write records to an Excel report if available, otherwise CSV"""
+        output_path = self._report_folder()
         
-        # Use Excel if available, otherwise CSV
         if self.use_excel:
-            return self._write_excel(output_path, timestamp, summary_stats)
+            return self._write_excel(output_path, timestamp, records, summary_stats)
         else:
-            return self._write_csv(output_path, timestamp, summary_stats)
+            return self._write_csv(output_path, timestamp, records, summary_stats)
+    
+    def _detach_stream(self) -> '_ReportStream':
+        """Take the open report stream; later records start a new report"""
+        stream, self._stream = self._stream, None
+        self.first_extraction_time = None
+        return stream
+    
+    def _finish_stream(self, stream: '_ReportStream', summary_stats: Optional[Dict]) -> Optional[Path]:
+        """Close the streaming report (summary appended at the end)"""
+        try:
+            path = stream.finish(summary_stats)
+        except Exception as e:
+            logger.error(f"Failed to finish streaming report: {e}", exc_info=True)
+            stream.abort()
+            return None
+        logger.info(f"Report written: {path} ({stream.record_count} records, streamed)")
+        return path
     
     def _write_excel(
         self,
         output_path: Path,
         timestamp: str,
+        records: Sequence[ExtractionRecord],
         summary_stats: Optional[Dict] = None
     ) -> Path:
         """
@@ -192,6 +713,7 @@ class CSVReporter:
         Args:
             output_path: Output directory
             timestamp: Timestamp for filename
+            records: Records to write
             summary_stats: Summary statistics to write at top
         
         Returns:
@@ -201,108 +723,24 @@ class CSVReporter:
             excel_filename = f"extraction_report_{timestamp}.xlsx"
             excel_path = output_path / excel_filename
             
-            # Create workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Extraction Report"
-            
-            # Define styles
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            error_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-            error_font = Font(color="FFFFFF", bold=True)
-            warning_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-            warning_font = Font(color="000000", bold=True)
-            summary_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-            summary_font = Font(bold=True, size=12)
-            center_align = Alignment(horizontal="center", vertical="center")
-            
-            current_row = 1
-            
-            # Write summary statistics first
-            if summary_stats:
-                ws.merge_cells(f'A{current_row}:D{current_row}')
-                summary_title = ws.cell(current_row, 1, "SUMMARY STATISTICS")
-                summary_title.font = Font(bold=True, size=14, color="1F4E78")
-                summary_title.alignment = center_align
-                current_row += 1
-                
-                # Write each stat
-                for key, value in summary_stats.items():
-                    label_cell = ws.cell(current_row, 1, key.replace('_', ' ').title())
-                    label_cell.font = summary_font
-                    label_cell.fill = summary_fill
-                    
-                    value_cell = ws.cell(current_row, 2, str(value))
-                    value_cell.fill = summary_fill
-                    
-                    current_row += 1
-                
-                current_row += 1  # Empty row separator
-            
-            # Write header row for data
-            fieldnames = list(self.pending_records[0].to_dict().keys())
-            for col_idx, fieldname in enumerate(fieldnames, start=1):
-                cell = ws.cell(current_row, col_idx, fieldname.replace('_', ' ').title())
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-            
-            current_row += 1
-            data_start_row = current_row
+            _write_excel_stream(
+                excel_path, records, "Extraction Report", _HEADER_FILL, summary_stats
+            )
             
-            # Write data rows with conditional formatting
-            for record in self.pending_records:
-                row_data = record.to_dict()
-                
-                for col_idx, fieldname in enumerate(fieldnames, start=1):
-                    cell = ws.cell(current_row, col_idx, row_data[fieldname])
-                    
-                    # Apply conditional formatting based on status
-                    if record.status == 'error':
-                        cell.fill = error_fill
-                        cell.font = error_font
-                    elif record.status == 'low_confidence':
-                        cell.fill = warning_fill
-                        cell.font = warning_font
-                
-                current_row += 1
-            
-            # Auto-size columns
-            for col_idx in range(1, len(fieldnames) + 1):
-                column_letter = get_column_letter(col_idx)
-                max_length = 0
-                
-                for cell in ws[column_letter]:
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
-            # Save workbook
-            wb.save(excel_path)
-            
-            logger.info(f"Excel report written: {excel_path} ({len(self.pending_records)} records)")
-            
-            # Clear pending records and reset time
-            self.pending_records.clear()
-            self.first_extraction_time = None
+            logger.info(f"Excel report written: {excel_path} ({len(records)} records)")
             
             return excel_path
         
         except Exception as e:
             logger.error(f"Failed to write Excel report: {e}", exc_info=True)
             # Fallback to CSV
-            return self._write_csv(output_path, timestamp, summary_stats)
+            return self._write_csv(output_path, timestamp, records, summary_stats)
     
     def _write_csv(
         self,
         output_path: Path,
         timestamp: str,
+        records: Sequence[ExtractionRecord],
         summary_stats: Optional[Dict] = None
     ) -> Path:
         """
@@ -311,6 +749,7 @@ class CSVReporter:
         Args:
             output_path: Output directory
             timestamp: Timestamp for filename
+            records: Records to write
             summary_stats: Summary statistics to write at top
         
         Returns:
@@ -320,7 +759,7 @@ class CSVReporter:
             csv_filename = f"extraction_report_{timestamp}.csv"
             csv_path = output_path / csv_filename
             
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
+            with open(csv_path, 'w', newline='', encoding='utf-8-sig', buffering=_WRITE_BUFFER) as f:
                 # Write summary first
                 if summary_stats:
                     f.write("# SUMMARY STATISTICS\n")
@@ -329,19 +768,12 @@ class CSVReporter:
                     f.write("\n")
                 
                 # Write data
-                if self.pending_records:
-                    fieldnames = list(self.pending_records[0].to_dict().keys())
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for record in self.pending_records:
-                        writer.writerow(record.to_dict())
-            
-            logger.info(f"CSV report written: {csv_path} ({len(self.pending_records)} records)")
+                if records:
+                    writer = csv.writer(f)
+                    writer.writerow(_FIELDS)
+                    writer.writerows(map(_record_row, records))
             
-            # Clear pending records and reset time
-            self.pending_records.clear()
-            self.first_extraction_time = None
+            logger.info(f"CSV report written: {csv_path} ({len(records)} records)")
             
             return csv_path
         
@@ -349,58 +781,47 @@ class CSVReporter:
             logger.error(f"Failed to write CSV report: {e}", exc_info=True)
             return None
     
-    def generate_summary_report(self, csv_path: Path) -> Dict:
+    def generate_summary_report(
+        self,
+        csv_path: Optional[Path] = None,
+        records: Optional[Iterable[Mapping[str, str]]] = None,
+        exact_unique: bool = False
+    ) -> Dict:
         """
-        Generate summary statistics from CSV
+        Generate summary statistics from a CSV report or from rows in memory
         
         Args:
             csv_path: Path to CSV file
+            records: Row mappings (CSV column -> string value) to summarize
+                instead of reading csv_path
+            exact_unique: Count unique headers/split groups exactly (memory
+                grows with the report) instead of estimating them with
+                HyperLogLog when datasketch is installed
         
         Returns:
             Dictionary of summary statistics
         """
         try:
-            records = []
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if not row.get('timestamp'):  # Skip summary rows
-                        break
-                    records.append(row)
-            
-            if not records:
-                return {}
+            # One streaming pass with running totals; no per-statistic re-scans
+            accumulator = _SummaryAccumulator(exact_unique)
             
-            # Calculate statistics
-            total_pages = len(records)
-            success_count = sum(1 for r in records if r['status'] == 'success')
-            error_count = sum(1 for r in records if r['status'] == 'error')
-            low_confidence_count = sum(1 for r in records if r['status'] == 'low_confidence')
-            
-            # Confidence scores
-            scores = [int(r['confidence_score']) for r in records if r['confidence_score'].isdigit()]
-            avg_score = sum(scores) / len(scores) if scores else 0
-            
-            # Processing times
-            times = [float(r['processing_time_ms']) for r in records if r['processing_time_ms']]
-            avg_time = sum(times) / len(times) if times else 0
-            
-            # Unique headers
-            unique_headers = len(set(r['header_extracted'] for r in records if r['header_extracted']))
+            if records is None:
+                f = open(csv_path, 'r', newline='', encoding='utf-8-sig')
+                records = csv.DictReader(f)
+            else:
+                f = None
             
-            summary = {
-                'total_pages': total_pages,
-                'success_count': success_count,
-                'error_count': error_count,
-                'low_confidence_count': low_confidence_count,
-                'success_rate': f"{(success_count / total_pages * 100):.1f}%",
-                'avg_confidence_score': round(avg_score, 1),
-                'avg_processing_time_ms': round(avg_time, 2),
-                'unique_headers': unique_headers,
-                'unique_split_groups': len(set(r['split_group'] for r in records if r['split_group']))
-            }
+            try:
+                for row in records:
+                    timestamp = row.get('timestamp')
+                    if not timestamp or timestamp.startswith('#'):  # Summary rows
+                        break
+                    accumulator.add(*[row[name] for name in _SUMMARY_COLUMNS])
+            finally:
+                if f is not None:
+                    f.close()
             
-            return summary
+            return accumulator.summary()
         
         except Exception as e:
             logger.error(f"Failed to generate summary: {e}")
@@ -437,58 +858,8 @@ class CSVReporter:
     def _write_error_excel(self, error_path: Path, error_records: List[ExtractionRecord]) -> Path:
         """Write error report in Excel format"""
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Error Report"
-            
-            # Define styles
-            header_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            error_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-            error_font = Font(color="FFFFFF", bold=True)
-            warning_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-            warning_font = Font(color="000000", bold=True)
-            center_align = Alignment(horizontal="center", vertical="center")
-            
-            # Write header
-            fieldnames = list(error_records[0].to_dict().keys())
-            for col_idx, fieldname in enumerate(fieldnames, start=1):
-                cell = ws.cell(1, col_idx, fieldname.replace('_', ' ').title())
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-            
-            # Write error records
-            for row_idx, record in enumerate(error_records, start=2):
-                row_data = record.to_dict()
-                
-                for col_idx, fieldname in enumerate(fieldnames, start=1):
-                    cell = ws.cell(row_idx, col_idx, row_data[fieldname])
-                    
-                    # Apply highlighting
-                    if record.status == 'error':
-                        cell.fill = error_fill
-                        cell.font = error_font
-                    elif record.status == 'low_confidence':
-                        cell.fill = warning_fill
-                        cell.font = warning_font
-            
-            # Auto-size columns
-            for col_idx in range(1, len(fieldnames) + 1):
-                column_letter = get_column_letter(col_idx)
-                max_length = 0
-                
-                for cell in ws[column_letter]:
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
-            wb.save(error_path)
+            # Red header fill marks the error report
+            _write_excel_stream(error_path, error_records, "Error Report", _ERROR_FILL)
             logger.info(f"Error report created: {error_path} ({len(error_records)} issues)")
             return error_path
         
@@ -499,13 +870,10 @@ class CSVReporter:
     def _write_error_csv(self, error_path: Path, error_records: List[ExtractionRecord]) -> Path:
         """Write error report in CSV format"""
         try:
-            with open(error_path, 'w', newline='', encoding='utf-8-sig') as f:
-                fieldnames = list(error_records[0].to_dict().keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for record in error_records:
-                    writer.writerow(record.to_dict())
+            with open(error_path, 'w', newline='', encoding='utf-8-sig', buffering=_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(_FIELDS)
+                writer.writerows(map(_record_row, error_records))
             
             logger.info(f"Error report created: {error_path} ({len(error_records)} issues)")
             return error_path
@@ -529,44 +897,70 @@ class CSVReporter:
             return None
         
         # Collect all CSV files for today
-        csv_files = list(date_folder.glob("extraction_report_*.csv"))
+        csv_files = sorted(date_folder.glob("extraction_report_*.csv"))  # Timestamped names: chronological
         
         if not csv_files:
             logger.warning(f"No extraction reports found for {today}")
             return None
         
-        # Aggregate data
-        all_records = []
-        for csv_file in csv_files:
-            try:
-                with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get('timestamp'):
-                            all_records.append(row)
-            except Exception as e:
-                logger.error(f"Failed to read {csv_file}: {e}")
-        
-        if not all_records:
-            return None
-        
-        # Write daily summary
+        # Stream every report's rows straight into one summary file instead
+        # of materializing all records in memory first. The BOM is written
+        # once by the utf-8-sig output; sources are read with it stripped.
         summary_path = date_folder / f"daily_summary_{today}.csv"
+        fieldnames = None
+        accumulator = _SummaryAccumulator()  # Stats gathered while rows are copied
+        
+        with open(summary_path, 'w', newline='', encoding='utf-8-sig', buffering=_WRITE_BUFFER) as out:
+            writer = csv.writer(out)
+            for csv_file in csv_files:
+                try:
+                    with open(csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+                        records = _rows_with_text(f)
+                        # Skip the "# SUMMARY STATISTICS" block that precedes the header
+                        header, header_text = next(
+                            ((row, text) for row, text in records if row and not row[0].startswith('#')),
+                            (None, None)
+                        )
+                        if header is None or 'timestamp' not in header:
+                            continue
+                        if fieldnames is None:
+                            fieldnames = header
+                            out.write(header_text)
+                        
+                        ts_idx = header.index('timestamp')
+                        # Keep data rows only (no blank/trailing '# summary' rows)
+                        records = (
+                            (row, text) for row, text in records
+                            if len(row) > ts_idx and row[ts_idx] and not row[0].startswith('#')
+                        )
+                        if header == fieldnames:
+                            # Same layout: copy each row's source text as-is
+                            positions = accumulator.positions(fieldnames)
+                            for row, text in records:
+                                accumulator.add_row(row, positions)
+                                out.write(text)
+                        else:
+                            # Older report layout: reorder columns to match the first file
+                            positions = [header.index(name) if name in header else None for name in fieldnames]
+                            rows = (
+                                [row[i] if i is not None and i < len(row) else '' for i in positions]
+                                for row, _ in records
+                            )
+                            writer.writerows(accumulator.tee(rows, fieldnames))
+                except Exception as e:
+                    logger.error(f"Failed to read {csv_file}: {e}")
+            
+            total_records = accumulator.total
+            if total_records:
+                # Append summary from the accumulated totals (no re-read of the file)
+                out.write("\n\n# Daily Summary Statistics\n")
+                for key, value in accumulator.summary().items():
+                    out.write(f"# {key},{value}\n")
+        
+        if not total_records:
+            summary_path.unlink()
+            return None
         
-        with open(summary_path, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=all_records[0].keys())
-            writer.writeheader()
-            writer.writerows(all_records)
-        
-        logger.info(f"Daily summary created: {summary_path} ({len(all_records)} records)")
-        
-        # Generate summary stats
-        summary_stats = self.generate_summary_report(summary_path)
-        
-        # Append summary
-        with open(summary_path, 'a', encoding='utf-8-sig') as f:
-            f.write("\n\n# Daily Summary Statistics\n")
-            for key, value in summary_stats.items():
-                f.write(f"# {key},{value}\n")
+        logger.info(f"Daily summary created: {summary_path} ({total_records} records)")
         
         return summary_path
@@ -3,13 +3,57 @@ Debug Image Manager - Manages debug image saving and cleanup
 """
 
 import logging
+import os
+import queue
+import threading
 import cv2
+import numpy as np
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+# Debug images favour encode speed over size (cv2 default PNG compression is 3)
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+_JPG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# Supported debug_format values; also the file suffixes cleanup looks for
+DEBUG_FORMATS = ('png', 'jpg', 'lz4')
+_DEBUG_SUFFIXES = tuple(f'.{fmt}' for fmt in DEBUG_FORMATS)
+
+# Queue sentinel telling the writer thread to exit
+_STOP = object()
+
+# Encoded images waiting for the writer; save_image blocks once this many are queued
+_WRITE_QUEUE_MAXSIZE = 64
+
+
+def _iter_old_images(dirpath: str, cutoff_ts: float):
+    """
+    Yield paths of debug image files under dirpath modified before cutoff_ts
+    
+    os.scandir reuses the directory entry's type info (no extra stat for
+    is_dir) and avoids building a Path object per file.
+    """
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_old_images(entry.path, cutoff_ts)
+            elif entry.name.endswith(_DEBUG_SUFFIXES):
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                        yield entry.path
+                except OSError:
+                    continue  # Removed while scanning
+
 
 class DebugImageManager:
     """
@@ -26,7 +70,8 @@ class DebugImageManager:
         base_folder: str = "debug_images",
         organize_by_date: bool = True,
         retention_days: int = 30,
-        enabled: bool = True
+        enabled: bool = True,
+        debug_format: str = 'jpg'
     ):
         """
         Initialize debug image manager
@@ -36,19 +81,57 @@ class DebugImageManager:
             organize_by_date: Organize images by date
             retention_days: Days to keep images (0 = forever)
             enabled: Enable/disable debug image saving
+            debug_format: 'jpg' (fast, small), 'png' (lossless) or
+                'lz4' (raw array; needs the lz4 package)
         """
+        debug_format = debug_format.lower()
+        if debug_format not in DEBUG_FORMATS:
+            raise ValueError(f"debug_format must be one of {DEBUG_FORMATS}, got {debug_format}")
+        if debug_format == 'lz4' and not LZ4_AVAILABLE:
+            logger.warning("lz4 not available - saving debug images as png")
+            debug_format = 'png'
+        
         self.base_folder = Path(base_folder)
         self.organize_by_date = organize_by_date
         self.retention_days = retention_days
         self.enabled = enabled
+        self.debug_format = debug_format
+        self._cleanup_thread: Optional[threading.Thread] = None
+        
+        # Encoded images are written to disk by one background thread; each
+        # writer gets its own queue so a save after close() starts afresh
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         
         if self.enabled:
             self.base_folder.mkdir(parents=True, exist_ok=True)
             logger.info(f"Debug images folder: {self.base_folder.absolute()}")
             
-            # Cleanup old images
+            # Cleanup old images in the background so a large debug folder
+            # doesn't delay startup; new images are never old enough to match
             if self.retention_days > 0:
-                self.cleanup_old_images()
+                self._cleanup_thread = threading.Thread(
+                    target=self.cleanup_old_images,
+                    daemon=True,
+                    name="DebugImageManager-Cleanup"
+                )
+                self._cleanup_thread.start()
+    
+    def wait_for_cleanup(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the startup cleanup to finish
+        
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+        
+        Returns:
+            bool: True if no cleanup is running anymore
+        """
+        if self._cleanup_thread is None:
+            return True
+        self._cleanup_thread.join(timeout)
+        return not self._cleanup_thread.is_alive()
     
     def get_debug_path(
         self,
@@ -85,15 +168,15 @@ class DebugImageManager:
             filename_base = Path(original_filename).stem if original_filename else "unknown"
             
             if method_name:
-                filename = f"{filename_base}_page{page_num}_{method_name}_{timestamp}.png"
+                filename = f"{filename_base}_page{page_num}_{method_name}_{timestamp}.{self.debug_format}"
             else:
-                filename = f"{filename_base}_page{page_num}_{timestamp}.png"
+                filename = f"{filename_base}_page{page_num}_{timestamp}.{self.debug_format}"
             
             return save_folder / filename
         
         except Exception as e:
             logger.error(f"Failed to generate debug path: {e}")
-            return Path(f"debug_page{page_num}.png")
+            return Path(f"debug_page{page_num}.{self.debug_format}")
     
     def save_image(
         self,
@@ -122,14 +205,85 @@ class DebugImageManager:
             if debug_path is None:
                 return None
             
-            cv2.imwrite(str(debug_path), image)
-            logger.debug(f"Saved debug image: {debug_path}")
+            # Encode on the caller's thread, hand the disk write to the writer thread
+            buffer = self._encode(image)
+            if buffer is None:
+                logger.error(f"Failed to encode debug image: {debug_path}")
+                return None
+            
+            self._enqueue((debug_path, buffer))
+            logger.debug(f"Queued debug image: {debug_path}")
             return debug_path
         
         except Exception as e:
             logger.error(f"Failed to save debug image: {e}")
             return None
     
+    def _encode(self, image):
+        """Encode image in the configured debug_format; None if encoding failed"""
+        if self.debug_format == 'lz4':
+            # .npy bytes keep shape/dtype; load with np.load(BytesIO(lz4.frame.decompress(data)))
+            raw = BytesIO()
+            np.save(raw, np.asarray(image), allow_pickle=False)
+            return lz4.frame.compress(raw.getbuffer())
+        
+        if self.debug_format == 'jpg':
+            ok, buffer = cv2.imencode('.jpg', image, _JPG_PARAMS)
+        else:
+            ok, buffer = cv2.imencode('.png', image, _PNG_PARAMS)
+        return buffer if ok else None
+    
+    def _enqueue(self, item):
+        """
+        Queue item for the writer thread, starting one on first use (or after close())
+        
+        The put happens under the lock so close() can never slip its _STOP
+        in ahead of an item that is already on its way to the queue.
+        """
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._write_queue = queue.Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+                self._writer_thread = threading.Thread(
+                    target=self._writer,
+                    args=(self._write_queue,),
+                    daemon=True,
+                    name="DebugImageManager-Writer"
+                )
+                self._writer_thread.start()
+            self._write_queue.put(item)
+    
+    def _writer(self, write_queue: queue.Queue):
+        """Write queued (path, encoded buffer) items until _STOP"""
+        while True:
+            item = write_queue.get()
+            if item is _STOP:
+                return
+            debug_path, buffer = item
+            try:
+                with open(debug_path, 'wb') as f:
+                    f.write(buffer)
+            except OSError as e:
+                logger.error(f"Failed to save debug image {debug_path}: {e}")
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write out all queued debug images and stop the writer thread
+        
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+        
+        Returns:
+            bool: True if every queued image was written
+        """
+        with self._writer_lock:
+            writer_thread = self._writer_thread
+            if writer_thread is None:
+                return True
+            self._write_queue.put(_STOP)
+            self._writer_thread = self._write_queue = None
+        writer_thread.join(timeout)
+        return not writer_thread.is_alive()
+    
     def cleanup_old_images(self) -> int:
         """
         Clean up images older than retention days
@@ -140,17 +294,15 @@ class DebugImageManager:
         if self.retention_days <= 0:
             return 0
         
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        # Compare raw st_mtime floats instead of building a datetime per file
+        cutoff_ts = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
         deleted_count = 0
         
         try:
-            for file_path in self.base_folder.rglob('*.png'):
+            for file_path in _iter_old_images(str(self.base_folder), cutoff_ts):
                 try:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    
-                    if file_time < cutoff_date:
-                        file_path.unlink()
-                        deleted_count += 1
+                    os.unlink(file_path)
+                    deleted_count += 1
                 
                 except Exception as e:
                     logger.warning(f"Failed to delete {file_path}: {e}")
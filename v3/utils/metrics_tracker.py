@@ -6,18 +6,48 @@ Tracks processing time, accuracy rate, API success rate
 import time
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional
-from collections import defaultdict
+from datetime import datetime, timedelta
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, NamedTuple, Optional, Union
 import json
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write data as indented UTF-8 JSON (orjson when installed: ~5x faster)"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Most recent completed jobs listed in the main export file
+EXPORTED_RECENT_JOBS = 100
+
+# Error messages kept per job (to_dict reports these; the rest are only counted)
+MAX_KEPT_ERRORS = 5
+
+
+@dataclass(slots=True)
 class ProcessingMetrics:
-    """Metrics for a single processing job"""
+    """
+    Metrics for a single processing job (slotted: no per-job __dict__)
+    
+    start_time/end_time are wall-clock (time.time()) for display and
+    grouping by day; durations come from the monotonic _start_ns/_end_ns,
+    which clock adjustments can't skew.
+    """
     job_id: str
     filename: str
     start_time: float
@@ -30,14 +60,21 @@ class ProcessingMetrics:
     api_calls: int = 0
     api_success: int = 0
     api_failures: int = 0
-    errors: List[str] = field(default_factory=list)
+    error_count: int = 0
+    errors: List[str] = field(default_factory=list)  # First MAX_KEPT_ERRORS messages
+    _start_ns: int = field(default_factory=time.monotonic_ns, repr=False)
+    _end_ns: Optional[int] = field(default=None, repr=False)
+    
+    def finish(self) -> None:
+        """Stamp the end of the job (wall clock and monotonic)"""
+        self._end_ns = time.monotonic_ns()
+        self.end_time = time.time()
     
     @property
     def processing_time_seconds(self) -> float:
         """Calculate processing time"""
-        if self.end_time is None:
-            return time.time() - self.start_time
-        return self.end_time - self.start_time
+        end_ns = self._end_ns if self._end_ns is not None else time.monotonic_ns()
+        return (end_ns - self._start_ns) * 1e-9
 
     @property
     def pages_processed_for_rate(self) -> int:
@@ -90,11 +127,47 @@ class ProcessingMetrics:
             'api_success': self.api_success,
             'api_failures': self.api_failures,
             'api_success_rate': round(self.api_success_rate, 2),
-            'errors_count': len(self.errors),
-            'errors': self.errors[:5]  # Only first 5 errors
+            'errors_count': self.error_count,
+            'errors': list(self.errors)  # Only first 5 errors
         }
 
 
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for start_job/end_job/record_* when tracking is disabled"""
+    return None
+
+
+class Aggregates(NamedTuple):
+    """Totals over a set of completed jobs (input to the summary dict)"""
+    total_jobs: int = 0
+    processing_time: float = 0.0
+    ocr_attempts: int = 0
+    ocr_successful: int = 0
+    api_calls: int = 0
+    api_success: int = 0
+    pages_processed: int = 0
+    fastest_job: float = 0
+    slowest_job: float = 0
+
+
+class Summary(NamedTuple):
+    """Summary statistics (get_summary); _asdict() gives the exported JSON object"""
+    total_jobs: int
+    active_jobs: int
+    total_pages_processed: int
+    avg_processing_time_seconds: float
+    avg_processing_per_page_seconds: float
+    total_processing_time_seconds: float
+    total_ocr_attempts: int
+    total_ocr_successful: int
+    ocr_success_rate: float
+    total_api_calls: int
+    total_api_success: int
+    api_success_rate: float
+    fastest_job: float
+    slowest_job: float
+
+
 class MetricsTracker:
     """
     Track performance metrics across all processing jobs
@@ -107,23 +180,39 @@ class MetricsTracker:
     - Export metrics to JSON
     """
     
-    def __init__(self, enable_tracking: bool = True):
+    def __init__(self, enable_tracking: bool = True, max_history: Optional[int] = None):
         """
         Initialize metrics tracker
         
         Args:
             enable_tracking: Enable/disable metrics tracking
+            max_history: Keep only this many completed jobs (None = all).
+                Summary totals still cover every job; daily export files
+                only list the jobs still kept.
         """
         self.enable_tracking = enable_tracking
         self.jobs: Dict[str, ProcessingMetrics] = {}
-        self.completed_jobs: List[ProcessingMetrics] = []
+        self.completed_jobs: Union[List[ProcessingMetrics], Deque[ProcessingMetrics]] = (
+            [] if max_history is None else deque(maxlen=max_history)
+        )
         
         # Aggregate statistics
+        self.total_jobs = 0
         self.total_processing_time = 0.0
         self.total_ocr_attempts = 0
         self.total_ocr_successful = 0
         self.total_api_calls = 0
         self.total_api_success = 0
+        self.total_pages_processed = 0
+        self.fastest_job: Optional[float] = None
+        self.slowest_job: Optional[float] = None
+        
+        if not enable_tracking:
+            # Disabled: callers' per-page record_* calls become a bare no-op
+            # call instead of a flag check and dict lookup each time
+            self.start_job = self.end_job = _noop
+            self.record_ocr_attempt = self.record_page_processed = _noop
+            self.record_api_call = self.record_error = _noop
         
         logger.info(f"MetricsTracker initialized (enabled: {enable_tracking})")
     
@@ -168,18 +257,25 @@ class MetricsTracker:
             return None
         
         metrics = self.jobs[job_id]
-        metrics.end_time = time.time()
+        metrics.finish()
         
         # Move to completed jobs
         self.completed_jobs.append(metrics)
         del self.jobs[job_id]
         
-        # Update aggregates
-        self.total_processing_time += metrics.processing_time_seconds
+        # Update aggregates (get_summary reads these instead of re-scanning jobs)
+        processing_time = metrics.processing_time_seconds
+        self.total_jobs += 1
+        self.total_processing_time += processing_time
         self.total_ocr_attempts += metrics.ocr_attempts
         self.total_ocr_successful += metrics.ocr_successful
         self.total_api_calls += metrics.api_calls
         self.total_api_success += metrics.api_success
+        self.total_pages_processed += metrics.pages_processed_for_rate
+        if self.fastest_job is None or processing_time < self.fastest_job:
+            self.fastest_job = processing_time
+        if self.slowest_job is None or processing_time > self.slowest_job:
+            self.slowest_job = processing_time
         
         logger.info(
             f"Job completed: {job_id} | "
@@ -192,29 +288,31 @@ class MetricsTracker:
     
     def record_ocr_attempt(self, job_id: str, successful: bool, score: int = 0):
         """Record an OCR attempt"""
-        if not self.enable_tracking or job_id not in self.jobs:
+        metrics = self.jobs.get(job_id)  # One lookup on the per-page path
+        if metrics is None or not self.enable_tracking:
             return
         
-        metrics = self.jobs[job_id]
         metrics.ocr_attempts += 1
         
         if successful:
             metrics.ocr_successful += 1
-            metrics.best_score = max(metrics.best_score, score)
+            if score > metrics.best_score:
+                metrics.best_score = score
 
     def record_page_processed(self, job_id: str, count: int = 1):
         """Record number of pages processed for a job."""
-        if not self.enable_tracking or job_id not in self.jobs:
+        metrics = self.jobs.get(job_id)
+        if metrics is None or not self.enable_tracking:
             return
-        metrics = self.jobs[job_id]
-        metrics.processed_pages += max(0, count)
+        if count > 0:
+            metrics.processed_pages += count
     
     def record_api_call(self, job_id: str, successful: bool):
         """Record an API call"""
-        if not self.enable_tracking or job_id not in self.jobs:
+        metrics = self.jobs.get(job_id)
+        if metrics is None or not self.enable_tracking:
             return
         
-        metrics = self.jobs[job_id]
         metrics.api_calls += 1
         
         if successful:
@@ -224,65 +322,123 @@ class MetricsTracker:
     
     def record_error(self, job_id: str, error_message: str):
         """Record an error"""
-        if not self.enable_tracking or job_id not in self.jobs:
+        metrics = self.jobs.get(job_id)
+        if metrics is None or not self.enable_tracking:
             return
         
-        metrics = self.jobs[job_id]
-        metrics.errors.append(error_message)
+        metrics.error_count += 1
+        if len(metrics.errors) < MAX_KEPT_ERRORS:
+            metrics.errors.append(error_message)
+    
+    @staticmethod
+    def _aggregate(jobs: List[ProcessingMetrics]) -> Aggregates:
+        """Totals over jobs in a single pass"""
+        processing_time = 0.0
+        ocr_attempts = ocr_successful = api_calls = api_success = pages_processed = 0
+        fastest = slowest = None
+        for m in jobs:
+            job_time = m.processing_time_seconds
+            processing_time += job_time
+            ocr_attempts += m.ocr_attempts
+            ocr_successful += m.ocr_successful
+            api_calls += m.api_calls
+            api_success += m.api_success
+            pages_processed += m.pages_processed_for_rate
+            if fastest is None or job_time < fastest:
+                fastest = job_time
+            if slowest is None or job_time > slowest:
+                slowest = job_time
+        return Aggregates(
+            len(jobs), processing_time, ocr_attempts, ocr_successful,
+            api_calls, api_success, pages_processed, fastest or 0, slowest or 0
+        )
     
-    def _summary_from_jobs(self, jobs: List[ProcessingMetrics]) -> dict:
+    def _summary_from_jobs(
+        self,
+        jobs: List[ProcessingMetrics],
+        aggregates: Optional[Aggregates] = None
+    ) -> Summary:
         """
         Build aggregate summary from a list of completed jobs.
+        
+        Pass aggregates when the totals are already known to skip the scan.
         """
-        total_jobs = len(jobs)
-        total_processing_time = sum(m.processing_time_seconds for m in jobs)
-        total_ocr_attempts = sum(m.ocr_attempts for m in jobs)
-        total_ocr_successful = sum(m.ocr_successful for m in jobs)
-        total_api_calls = sum(m.api_calls for m in jobs)
-        total_api_success = sum(m.api_success for m in jobs)
-        total_pages_processed = sum(m.pages_processed_for_rate for m in jobs)
+        if aggregates is None:
+            aggregates = self._aggregate(jobs)
+        
+        total_jobs = aggregates.total_jobs
+        total_processing_time = aggregates.processing_time
+        total_ocr_attempts = aggregates.ocr_attempts
+        total_ocr_successful = aggregates.ocr_successful
+        total_api_calls = aggregates.api_calls
+        total_api_success = aggregates.api_success
+        total_pages_processed = aggregates.pages_processed
 
         avg_time = (total_processing_time / total_jobs) if total_jobs > 0 else 0.0
         avg_per_page = (total_processing_time / total_pages_processed) if total_pages_processed > 0 else 0.0
         ocr_rate = (total_ocr_successful / total_ocr_attempts * 100) if total_ocr_attempts > 0 else 0.0
         api_rate = (total_api_success / total_api_calls * 100) if total_api_calls > 0 else 0.0
 
-        return {
-            'total_jobs': total_jobs,
-            'active_jobs': len(self.jobs),
-            'total_pages_processed': total_pages_processed,
-            'avg_processing_time_seconds': round(avg_time, 2),
-            'avg_processing_per_page_seconds': round(avg_per_page, 3),
-            'total_processing_time_seconds': round(total_processing_time, 2),
-            'total_ocr_attempts': total_ocr_attempts,
-            'total_ocr_successful': total_ocr_successful,
-            'ocr_success_rate': round(ocr_rate, 2),
-            'total_api_calls': total_api_calls,
-            'total_api_success': total_api_success,
-            'api_success_rate': round(api_rate, 2),
-            'fastest_job': min((m.processing_time_seconds for m in jobs), default=0),
-            'slowest_job': max((m.processing_time_seconds for m in jobs), default=0),
-        }
+        return Summary(
+            total_jobs=total_jobs,
+            active_jobs=len(self.jobs),
+            total_pages_processed=total_pages_processed,
+            avg_processing_time_seconds=round(avg_time, 2),
+            avg_processing_per_page_seconds=round(avg_per_page, 3),
+            total_processing_time_seconds=round(total_processing_time, 2),
+            total_ocr_attempts=total_ocr_attempts,
+            total_ocr_successful=total_ocr_successful,
+            ocr_success_rate=round(ocr_rate, 2),
+            total_api_calls=total_api_calls,
+            total_api_success=total_api_success,
+            api_success_rate=round(api_rate, 2),
+            fastest_job=aggregates.fastest_job,
+            slowest_job=aggregates.slowest_job,
+        )
 
-    def get_summary(self) -> dict:
+    def get_summary(self) -> Summary:
         """
         Get summary statistics
         
+        Built from the running totals end_job() maintains, so this is O(1)
+        however many jobs have completed.
+        
         Returns:
-            dict: Summary statistics
+            Summary: Summary statistics (use ._asdict() for a dict)
         """
-        if len(self.completed_jobs) == 0:
-            return self._summary_from_jobs([])
-        return self._summary_from_jobs(self.completed_jobs)
+        aggregates = Aggregates(
+            total_jobs=self.total_jobs,
+            processing_time=self.total_processing_time,
+            ocr_attempts=self.total_ocr_attempts,
+            ocr_successful=self.total_ocr_successful,
+            api_calls=self.total_api_calls,
+            api_success=self.total_api_success,
+            pages_processed=self.total_pages_processed,
+            fastest_job=self.fastest_job or 0,
+            slowest_job=self.slowest_job or 0,
+        )
+        return self._summary_from_jobs(self.completed_jobs, aggregates)
 
     def _group_completed_jobs_by_day(self) -> Dict[str, List[ProcessingMetrics]]:
         """Group completed jobs by completion date (YYYY-MM-DD)."""
-        grouped: Dict[str, List[ProcessingMetrics]] = defaultdict(list)
-        for job in self.completed_jobs:
-            if job.end_time is None:
-                continue
-            day = datetime.fromtimestamp(job.end_time).strftime('%Y-%m-%d')
-            grouped[day].append(job)
+        # Jobs complete in (almost) end_time order, so this sort is ~linear.
+        # Walking them in order, a date is only formatted when a job crosses
+        # the next local midnight: O(days) strftime calls, not O(jobs).
+        finished = sorted(
+            (job for job in self.completed_jobs if job.end_time is not None),
+            key=lambda job: job.end_time
+        )
+        grouped: Dict[str, List[ProcessingMetrics]] = {}
+        next_midnight = float('-inf')
+        day_jobs: List[ProcessingMetrics] = []
+        for job in finished:
+            if job.end_time >= next_midnight:
+                day_start = datetime.fromtimestamp(job.end_time).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+                next_midnight = (day_start + timedelta(days=1)).timestamp()
+                day_jobs = grouped.setdefault(day_start.strftime('%Y-%m-%d'), [])
+            day_jobs.append(job)
         return grouped
     
     def export_to_json(self, filepath: str):
@@ -298,13 +454,14 @@ class MetricsTracker:
 
             data = {
                 'format_version': '2.0',
-                'summary': self.get_summary(),
+                'summary': self.get_summary()._asdict(),
                 'timestamp': datetime.now().isoformat(),
-                'completed_jobs': [m.to_dict() for m in self.completed_jobs[-100:]]  # Last 100 jobs
+                'completed_jobs': [
+                    m.to_dict()
+                    for m in islice(self.completed_jobs, max(0, len(self.completed_jobs) - EXPORTED_RECENT_JOBS), None)
+                ]
             }
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json(output_path, data)
             
             # Export daily-separated files for professional reporting
             daily_dir = output_path.parent / 'daily'
@@ -316,12 +473,11 @@ class MetricsTracker:
                 day_payload = {
                     'format_version': '2.0',
                     'day': day,
-                    'summary': self._summary_from_jobs(jobs),
+                    'summary': self._summary_from_jobs(jobs)._asdict(),
                     'exported_at': datetime.now().isoformat(),
                     'jobs': [m.to_dict() for m in jobs]
                 }
-                with open(day_file, 'w', encoding='utf-8') as f:
-                    json.dump(day_payload, f, indent=2, ensure_ascii=False)
+                _write_json(day_file, day_payload)
             
             logger.info(f"Metrics exported to: {output_path}")
             logger.info(f"Daily metrics exported to: {daily_dir}")
@@ -337,21 +493,21 @@ class MetricsTracker:
         print("PERFORMANCE METRICS SUMMARY")
         print("="*60)
         print(f"Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Total Jobs Completed: {summary['total_jobs']}")
-        print(f"Active Jobs: {summary['active_jobs']}")
-        print(f"Total Pages Processed: {summary['total_pages_processed']}")
-        print(f"Average Processing Time / Job: {summary['avg_processing_time_seconds']:.2f}s")
-        print(f"Average Processing Time / Page: {summary['avg_processing_per_page_seconds']:.3f}s")
-        print(f"Total Processing Time: {summary['total_processing_time_seconds']:.2f}s")
+        print(f"Total Jobs Completed: {summary.total_jobs}")
+        print(f"Active Jobs: {summary.active_jobs}")
+        print(f"Total Pages Processed: {summary.total_pages_processed}")
+        print(f"Average Processing Time / Job: {summary.avg_processing_time_seconds:.2f}s")
+        print(f"Average Processing Time / Page: {summary.avg_processing_per_page_seconds:.3f}s")
+        print(f"Total Processing Time: {summary.total_processing_time_seconds:.2f}s")
         print(f"\nOCR Performance:")
-        print(f"  Success Rate: {summary['ocr_success_rate']:.2f}%")
-        print(f"  Total Attempts: {summary['total_ocr_attempts']}")
-        print(f"  Successful: {summary['total_ocr_successful']}")
+        print(f"  Success Rate: {summary.ocr_success_rate:.2f}%")
+        print(f"  Total Attempts: {summary.total_ocr_attempts}")
+        print(f"  Successful: {summary.total_ocr_successful}")
         print(f"\nAPI Performance:")
-        print(f"  Success Rate: {summary['api_success_rate']:.2f}%")
-        print(f"  Total Calls: {summary['total_api_calls']}")
-        print(f"  Successful: {summary['total_api_success']}")
+        print(f"  Success Rate: {summary.api_success_rate:.2f}%")
+        print(f"  Total Calls: {summary.total_api_calls}")
+        print(f"  Successful: {summary.total_api_success}")
         print(f"\nPerformance Range:")
-        print(f"  Fastest Job: {summary['fastest_job']:.2f}s")
-        print(f"  Slowest Job: {summary['slowest_job']:.2f}s")
+        print(f"  Fastest Job: {summary.fastest_job:.2f}s")
+        print(f"  Slowest Job: {summary.slowest_job:.2f}s")
         print("="*60 + "\n")
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OCRContext:
     """
     Immutable context for each OCR operation
@@ -20,6 +20,7 @@ class OCRContext:
     - Thread-safe: Each job has its own context
     - Immutable: Cannot be accidentally modified
     - Explicit: All data passed explicitly, no hidden state
+    - Lightweight: slots, no per-instance __dict__ (one context per page)
     
     Attributes:
         filename: Original PDF filename
@@ -51,12 +52,9 @@ class OCRContext:
         Returns:
             OCRContext: New context with updated scale
         """
-        return OCRContext(
-            filename=self.filename,
-            page_num=self.page_num,
-            render_scale=new_scale,
-            job_id=self.job_id
-        )
+        if new_scale <= 0:
+            raise ValueError(f"render_scale must be > 0, got {new_scale}")
+        return self._derive(new_scale, self.job_id)
     
     def with_job_id(self, job_id: str) -> 'OCRContext':
         """
@@ -68,9 +66,13 @@ class OCRContext:
         Returns:
             OCRContext: New context with job ID
         """
-        return OCRContext(
-            filename=self.filename,
-            page_num=self.page_num,
-            render_scale=self.render_scale,
-            job_id=job_id
-        )
+        return self._derive(self.render_scale, job_id)
+    
+    def _derive(self, render_scale: float, job_id: Optional[str]) -> 'OCRContext':
+        """Copy without re-running __post_init__ (callers validate what they change)"""
+        context = object.__new__(OCRContext)
+        object.__setattr__(context, 'filename', self.filename)
+        object.__setattr__(context, 'page_num', self.page_num)
+        object.__setattr__(context, 'render_scale', render_scale)
+        object.__setattr__(context, 'job_id', job_id)
+        return context